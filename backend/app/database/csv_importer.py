@@ -4,9 +4,12 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from .connection import SessionLocal, engine
+from .station_fts import ensure_station_fts
 from ..models.bus_station_model import BusStation
 from ..models.saved_route_model import SavedRoute
 from ..models.base_model import Base
+from ..services.station_index import station_index
+from ..utils.geo import grid_cell_id
 
 def import_bus_stations_from_csv(csv_file_path: str, location: str = "SEL"):
     """CSV 파일에서 버스 정류소 데이터를 읽어서 데이터베이스에 입력"""
@@ -79,7 +82,8 @@ def import_bus_stations_from_csv(csv_file_path: str, location: str = "SEL"):
                         station_name=station_name,
                         longitude=longitude,
                         latitude=latitude,
-                        location=location
+                        location=location,
+                        grid_cell=grid_cell_id(latitude, longitude)
                     )
                     
                     db.add(bus_station)
@@ -106,6 +110,10 @@ def import_bus_stations_from_csv(csv_file_path: str, location: str = "SEL"):
         saved_routes_count = db.query(SavedRoute).count()
         print(f"saved_routes 테이블 생성 완료 (현재 데이터: {saved_routes_count}개)")
         
+        # 정류소 FTS 색인 동기화 및 인덱스 갱신 (서버 프로세스는 DB 버전 변경을 감지해 재생성)
+        ensure_station_fts(engine, rebuild=True)
+        station_index.invalidate()
+        
     except Exception as e:
         print(f"데이터 입력 중 오류 발생: {e}")
         db.rollback()
@@ -218,7 +226,8 @@ def import_kyg_bus_stations_from_csv(csv_file_path: str):
                         station_name=station_name,
                         longitude=lon,
                         latitude=lat,
-                        location="KYG"  # 경기도 버스 정류소는 "KYG"로 설정
+                        location="KYG",  # 경기도 버스 정류소는 "KYG"로 설정
+                        grid_cell=grid_cell_id(lat, lon)
                     )
                     
                     db.add(bus_station)
@@ -239,6 +248,10 @@ def import_kyg_bus_stations_from_csv(csv_file_path: str):
         print(f"경기도 버스 정류소 데이터 입력 완료: {imported_count}개")
         print(f"건너뛴 데이터: {skipped_count}개")
         
+        # 정류소 FTS 색인 동기화 및 인덱스 갱신 (서버 프로세스는 DB 버전 변경을 감지해 재생성)
+        ensure_station_fts(engine, rebuild=True)
+        station_index.invalidate()
+        
     except Exception as e:
         print(f"데이터 입력 중 오류 발생: {e}")
         db.rollback()
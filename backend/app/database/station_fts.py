@@ -0,0 +1,74 @@
+from typing import Iterable, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# bus_stations.station_name 을 미러링하는 FTS5 가상 테이블 (trigram 토크나이저: 한글 부분 문자열 검색)
+FTS_TABLE = "bus_stations_fts"
+# trigram 토크나이저로 색인을 쓸 수 있는 최소 검색어 길이
+FTS_MIN_QUERY_LENGTH = 3
+
+def ensure_station_fts(engine: Engine, rebuild: bool = False) -> bool:
+    """FTS5 가상 테이블 생성 및 동기화 (SQLite가 아니거나 trigram을 지원하지 않으면 False)"""
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                    station_name,
+                    content='bus_stations',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+            """))
+
+            # 정류소 입력 후이거나 FTS 테이블이 비어 있으면 bus_stations 기준으로 다시 색인
+            indexed = connection.execute(text(f"SELECT COUNT(*) FROM {FTS_TABLE}_docsize")).scalar()
+            stations = connection.execute(text("SELECT COUNT(*) FROM bus_stations")).scalar()
+            if rebuild or (stations and not indexed):
+                connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                print(f"정류소 FTS 색인 동기화 완료: {stations}개")
+        return True
+    except Exception as e:
+        print(f"⚠️ 정류소 FTS 색인 동기화 실패: {e}")
+        return False
+
+def search_station_fts(db: Session, query: str, after: Optional[str] = None, limit: Optional[int] = None) -> Iterable:
+    """FTS5로 정류소 이름 검색 (ars_id, station_name, longitude, latitude), 관련도 순
+
+    after에 직전 페이지 마지막 정류소의 ars_id를 주면 그 다음부터 조회 (키셋 페이지네이션).
+    결과는 DB 커서에서 한 행씩 읽히는 Result 객체로 반환.
+    """
+    query = query.strip()
+    params = {"limit": limit if limit is not None else -1}
+    if len(query) < FTS_MIN_QUERY_LENGTH:
+        # trigram 색인을 쓸 수 없는 짧은 검색어는 LIKE 검색 (이름 길이, id 순)
+        source = "FROM bus_stations s WHERE s.station_name LIKE :pattern"
+        sort_key = "length(s.station_name)"
+        params["pattern"] = f"%{query}%"
+    else:
+        # 검색어 전체를 하나의 구문으로 검색 (큰따옴표 이스케이프)
+        source = f"FROM {FTS_TABLE} f JOIN bus_stations s ON s.id = f.rowid WHERE {FTS_TABLE} MATCH :phrase"
+        sort_key = "f.rank"
+        params["phrase"] = '"' + query.replace('"', '""') + '"'
+
+    cursor_filter = ""
+    if after:
+        # 커서 정류소의 정렬 키 (같은 검색 조건 안에서 계산)
+        key = db.execute(
+            text(f"SELECT {sort_key}, s.id {source} AND s.ars_id = :after"),
+            {**params, "after": after}
+        ).fetchone()
+        if key is None:
+            raise ValueError(f"검색 결과에 없는 커서입니다: {after}")
+        cursor_filter = f"AND ({sort_key} > :after_key OR ({sort_key} = :after_key AND s.id > :after_id))"
+        params.update(after_key=key[0], after_id=key[1])
+
+    return db.execute(text(f"""
+        SELECT s.ars_id, s.station_name, s.longitude, s.latitude
+        {source}
+        {cursor_filter}
+        ORDER BY {sort_key}, s.id
+        LIMIT :limit
+    """), params)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer
+from sqlalchemy import Column, String, Float, Integer, BigInteger, Index
 from .base_model import BaseModel
 
 class BusStation(BaseModel):
@@ -11,4 +11,10 @@ class BusStation(BaseModel):
     station_name = Column(String(100), nullable=False, index=True)
     longitude = Column(Float, nullable=False)  # tmX -> longitude
     latitude = Column(Float, nullable=False)   # tmY -> latitude
-    location = Column(String(50), nullable=True, default="SEL")  # 위치 정보 (서울: SEL) 
\ No newline at end of file
+    location = Column(String(50), nullable=True, default="SEL")  # 위치 정보 (서울: SEL)
+    grid_cell = Column(BigInteger, nullable=True)  # 위경도 격자 셀 ID (utils.geo.grid_cell_id)
+    
+    # 격자 셀 + 위경도 복합 인덱스 (주변 정류소 SQL 사전 필터용)
+    __table_args__ = (
+        Index('ix_bus_stations_grid_cell_lat_lon', 'grid_cell', 'latitude', 'longitude'),
+    ) 
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Text, DateTime
+from .base_model import BaseModel
+
+class StationRouteCache(BaseModel):
+    """정류소 경유 노선 목록 캐시 모델 (getRouteByStation 응답)"""
+
+    __tablename__ = "station_route_cache"
+
+    ars_id = Column(String(50), unique=True, nullable=False, index=True)
+    routes_json = Column(Text, nullable=False)  # 노선 목록 (itemList JSON)
+    fetched_at = Column(DateTime, nullable=False, index=True)  # 외부 API에서 받아온 시각
@@ -1,15 +1,34 @@
 from .base_router import BaseRouter
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response, WebSocket
+from fastapi.responses import StreamingResponse, ORJSONResponse
 from sqlalchemy.orm import Session
-from app.database.connection import get_db
+from app.database.connection import get_db, SessionLocal
+from app.database.station_fts import search_station_fts
 from app.models.bus_station_model import BusStation
-from typing import List
-from math import radians, cos, sin, asin, sqrt
-import requests
-import re
-import os
+from app.models.user_model import User
+from app.schemas.bus_station_schema import ArrivalBatchRequest
+from app.services.station_index import station_index, query_radius_db, StationRecord
+from app.services.upstream_client import upstream_clients, UpstreamError
+from app.services.arrival_cache import arrival_cache
+from app.services.arrival_record import arrival_sort_key, record_to_dict
+from app.services.bus_providers import provider_registry
+from app.services.arrival_hub import arrival_hub, ArrivalSubscriber
+from app.services.route_cache import route_cache
+from app.services.arrival_prefetcher import arrival_prefetcher
+from app.services.station_tiles import station_tile_cache, MIN_TILE_ZOOM, MAX_TILE_ZOOM, TILE_MAX_AGE
+from app.services.station_clusters import station_cluster_index, MIN_CLUSTER_ZOOM, MAX_CLUSTER_ZOOM
+from app.services.station_search_index import station_name_index, station_choseong_index, station_autocomplete
+from app.utils.hangul import is_choseong_query
+from app.utils.auth import get_current_user
+from app.utils.compression import etag_base
+from config import settings
+from typing import List, Optional
+from bisect import bisect_right
+import asyncio
+from itertools import islice
+import json
+import orjson
 from dotenv import load_dotenv
-import ssl
 
 load_dotenv()
 
@@ -18,356 +37,397 @@ class BusStationRouter(BaseRouter):
     
     def __init__(self):
         super().__init__()
-        self.API_KEY = os.getenv("DECODED_DATA_API_KEY")
         self.setup_routes()
     
-    def haversine(self, lat1, lon1, lat2, lon2):
-        """거리 계산 (Haversine 공식)"""
-        R = 6371000  # 지구 반지름 (단위: m)
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
-        a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
-        c = 2 * asin(sqrt(a))
-        return R * c
-    
-    def get_arrival_info_by_ars_id(self, ars_id):
-        """정류소ID -> 정류소 도착 노선ID, 이름,노선유형, 도착정보"""
-        url = 'http://ws.bus.go.kr/api/rest/stationinfo/getStationByUid'
-        params = {
-            'serviceKey': self.API_KEY,
-            'arsId': ars_id,
-            'resultType': 'json'
-        }
-
-        response = requests.get(url, params=params)
-        result = []
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                item_list = data['msgBody'].get('itemList', [])
-
-                if isinstance(item_list, dict):
-                    item_list = [item_list]
-                for item in item_list:
-                    result.append({
-                        'busRouteId': item['busRouteId'],
-                        'rtNm': item['rtNm'],
-                        'arrmsg1': item['arrmsg1'],
-                        'arrmsg2': item['arrmsg2'],
-                        'direction': item['adirection']
-                    })
-
-            except Exception as e:
-                print("⚠️ JSON 파싱 오류:", e)
-        else:
-            print("❌ 요청 실패:", response.status_code)
-
-        return result
-
-    def get_routes_by_station(self, ars_id):
-        """정류소ID -> 지나는 모든 버스 노선 id,이름,첫차,막차,유형등"""
-        url = 'http://ws.bus.go.kr/api/rest/stationinfo/getRouteByStation'
-        params = {
-            'serviceKey': self.API_KEY,
-            'arsId': ars_id,
-            'resultType': 'json'
-        }
+    def get_station_location(self, ars_id, db: Session = None):
+        """정류소 지역 코드 (DB location, 등록되지 않은 지역이거나 정보가 없으면 기본 지역)"""
+        location = None
+        if db:
+            station = db.query(BusStation.location).filter(BusStation.ars_id == ars_id).first()
+            location = station.location if station else None
+        return provider_registry.resolve(location)
 
-        response = requests.get(url, params=params)
+    def get_station_locations(self, ars_ids, db: Session):
+        """여러 정류소의 지역 코드 (한 번의 DB 조회, 정보가 없으면 기본 지역)"""
+        rows = db.query(BusStation.ars_id, BusStation.location) \
+            .filter(BusStation.ars_id.in_(ars_ids)) \
+            .all()
+        locations = {row.ars_id: row.location for row in rows}
+        return {ars_id: provider_registry.resolve(locations.get(ars_id)) for ars_id in ars_ids}
 
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                item_list = data.get('msgBody', {}).get('itemList', [])
-                
-                # None인 경우 빈 리스트로 처리
-                if item_list is None:
-                    item_list = []
+    async def get_bus_list_with_age(self, ars_id, db: Session = None, max_stale: float = 0.0):
+        """정류소 지나는 모든 버스노선 + 지역 코드 + 데이터 경과 시간 (DB location의 지역 제공자로 조회, max_stale > 0 이면 stale-while-revalidate)"""
+        location = self.get_station_location(ars_id, db)
+        arrivals, age = await provider_registry.get_bus_list(location, ars_id, max_stale)
+        return arrivals, location, age
 
-                # 하나만 올 경우 dict → list
-                if isinstance(item_list, dict):
-                    item_list = [item_list]
+    async def get_bus_lists(self, ars_ids, db: Session):
+        """여러 정류소의 버스 목록 동시 조회 (ars_id -> 목록 또는 예외)"""
+        return await provider_registry.get_bus_lists(self.get_station_locations(ars_ids, db))
+    
+    def update_stream_subscription(self, subscriber: ArrivalSubscriber, request) -> List[str]:
+        """실시간 구독 요청 처리 ({"subscribe": [arsId, ...]}, {"unsubscribe": [arsId, ...]}), 없는 정류소 목록 반환"""
+        if not isinstance(request, dict) or not all(
+            isinstance(request.get(field) or [], list) for field in ("subscribe", "unsubscribe")
+        ):
+            raise ValueError("구독 요청 형식이 올바르지 않습니다")
+        requested = request.get("subscribe") or []
+        if len(requested) > settings.ARRIVAL_STREAM_MAX_STATIONS:
+            raise ValueError(f"한 연결에서 구독할 수 있는 정류소는 최대 {settings.ARRIVAL_STREAM_MAX_STATIONS}개입니다")
+        for ars_id in request.get("unsubscribe") or []:
+            arrival_hub.unsubscribe(subscriber, str(ars_id).strip())
 
-                return item_list
-            except Exception as e:
-                print(f"⚠️ API 응답 파싱 오류: {e}")
-                return []
-        else:
-            print(f"❌ API 요청 실패: {response.status_code}")
+        subscribed = {ars_id for _, ars_id in subscriber.stations}
+        ars_ids = [
+            ars_id for ars_id in dict.fromkeys(str(ars_id).strip() for ars_id in requested)
+            if ars_id and ars_id not in subscribed
+        ]
+        if not ars_ids:
             return []
+        if len(subscribed) + len(ars_ids) > settings.ARRIVAL_STREAM_MAX_STATIONS:
+            raise ValueError(f"한 연결에서 구독할 수 있는 정류소는 최대 {settings.ARRIVAL_STREAM_MAX_STATIONS}개입니다")
 
-    def get_bus_list_sel(self, ars_id):
-        """정류소 지나는 모든 버스노선 (기존 로직)"""
-        routes = self.get_routes_by_station(ars_id)  # 전체 노선 목록
-        arrivals = self.get_arrival_info_by_ars_id(ars_id)  # 실시간 도착정보
-
-        # routes가 None이면 빈 리스트로 처리
-        if routes is None:
-            routes = []
-
-        # 도착 정보를 dict 형태로 매핑
-        arrival_map = {a['busRouteId']: a for a in arrivals}
-
-        result = []
-        for r in routes:
-            route_id = r['busRouteId']
-            bus = {
-                'busRouteId': route_id,
-                'rtNm': r['busRouteNm'],
-                'routeType': r['busRouteType'],
-                'arrmsg1': '',
-                'arrmsg2': '',
-                'direction': '',
-                'arsId': ars_id 
-            }
-
-            if route_id in arrival_map:
-                bus['arrmsg1'] = arrival_map[route_id]['arrmsg1']
-                bus['arrmsg2'] = arrival_map[route_id]['arrmsg2']
-                bus['direction'] = arrival_map[route_id]['direction']
-            else:
-                bus['arrmsg1'] = '도착 정보 없음'
-                bus['arrmsg2'] = ''
-                bus['direction'] = ''
-
-            result.append(bus)
-        return result
+        # 연결이 유지되는 동안 세션을 잡고 있지 않도록 요청마다 짧게 사용
+        db = SessionLocal()
+        try:
+            rows = db.query(BusStation.ars_id, BusStation.location) \
+                .filter(BusStation.ars_id.in_(ars_ids)) \
+                .all()
+        finally:
+            db.close()
+        # 정류소 테이블에 없는 ars_id는 구독하지 않음 (없는 정류소마다 외부 API를 계속 호출하지 않도록)
+        locations = {row.ars_id: row.location for row in rows}
+        for ars_id in ars_ids:
+            if ars_id in locations:
+                arrival_hub.subscribe(subscriber, locations[ars_id], ars_id)
+        return [ars_id for ars_id in ars_ids if ars_id not in locations]
 
-    def get_bus_list_kyg(self, station_id, service_key=None, format_type='json'):
-        """경기도 버스 정류소 도착 정보 조회"""
-        if not service_key:
-            service_key = self.API_KEY
+    def arrivals_to_response(self, arrivals):
+        """도착 정보 응답 형식 (도착 시간 빠른 순, 표시 문구는 여기서 생성)"""
+        return [record_to_dict(record) for record in sorted(arrivals, key=arrival_sort_key)]
 
-        
-        url = 'https://apis.data.go.kr/6410000/busarrivalservice/v2/getBusArrivalListv2'
-        params = {
-            'serviceKey': service_key,
-            'stationId': station_id,
-            'format': format_type
+    def station_to_dict(self, station):
+        """검색 결과 정류소 응답 형식"""
+        return {
+            "stNm": station.station_name,
+            "arsId": station.ars_id,
+            "x": station.longitude,
+            "y": station.latitude
         }
+    
+    def ndjson_chunks(self, stations):
+        """검색 결과 ndjson 조각 (줄마다 보내면 압축 효율이 떨어지므로 NDJSON_CHUNK_SIZE줄씩 묶음)"""
+        lines = []
+        for station in stations:
+            lines.append(orjson.dumps(self.station_to_dict(station)))
+            if len(lines) >= settings.NDJSON_CHUNK_SIZE:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
 
-        result = []
-
-        try:
-            # 경기도 API는 SSL 문제가 있으므로 HTTP로 시도
-            http_url = url.replace('https://', 'http://')
-            
-            # 세션 생성 및 SSL 설정
-            session = requests.Session()
-            session.verify = False
-            
-            # 헤더 추가
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/json, text/xml, */*',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Cache-Control': 'no-cache'
-            }
-            
-            response = session.get(http_url, params=params, headers=headers, timeout=10)
+    def search_stations(self, db: Session, name: str, after: Optional[str] = None, limit: Optional[int] = None):
+        """정류소 이름 검색 결과를 한 건씩 반환 (after 다음부터, 최대 limit개)"""
+        if is_choseong_query(name) or settings.STATION_SEARCH_MODE != "fts":
+            # 초성만 입력한 경우 (예: "ㄱㄴㅇ" -> 강남역) 초성 색인, 그 외에는 n-gram 역색인으로 검색
+            name_index = station_choseong_index if is_choseong_query(name) else station_name_index
+            indices = name_index.search(db, name)
+            catalog = name_index.catalog
             
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    
-                    # 경기도 API 응답 구조에 맞게 파싱
-                    if 'response' in data and 'msgBody' in data['response']:
-                        msg_body = data['response']['msgBody']
-                        
-                        if 'busArrivalList' in msg_body:
-                            items = msg_body['busArrivalList']
-                            
-                            if isinstance(items, dict):
-                                items = [items]
-                            
-                            for item in items:
-                                
-                                # predictTimeSec1을 분:초 형식으로 변환
-                                predict_time_sec1 = item.get('predictTimeSec1', 0)
-                                predict_time_sec2 = item.get('predictTimeSec2', 0)
-                                location_no1 = item.get('locationNo1', 0)
-                                location_no2 = item.get('locationNo2', 0)
-                                
-                                # 빈 문자열이나 None 값을 0으로 변환
-                                if predict_time_sec1 == '' or predict_time_sec1 is None:
-                                    predict_time_sec1 = 0
-                                if predict_time_sec2 == '' or predict_time_sec2 is None:
-                                    predict_time_sec2 = 0
-                                if location_no1 == '' or location_no1 is None:
-                                    location_no1 = 0
-                                if location_no2 == '' or location_no2 is None:
-                                    location_no2 = 0
-                                
-                                # 초를 분:초 형식으로 변환
-                                def format_time(seconds):
-                                    if seconds <= 0:
-                                        return "정보 없음"
-                                    elif seconds <= 60:  # 1분 이하
-                                        return "곧 도착"
-                                    minutes = seconds // 60
-                                    remaining_seconds = seconds % 60
-                                    if minutes > 0:
-                                        return f"{minutes}분{remaining_seconds}초"
-                                    else:
-                                        return f"{remaining_seconds}초"
-                                
-                                # 위치 정보 추가
-                                def format_arrival_msg(seconds, location_no):
-                                    time_str = format_time(seconds)
-                                    if location_no > 0:
-                                        return f"{time_str}[{location_no}번째 전]"
-                                    else:
-                                        return time_str
-                                
-                                arrmsg1 = format_arrival_msg(predict_time_sec1, location_no1)
-                                arrmsg2 = format_arrival_msg(predict_time_sec2, location_no2) if predict_time_sec2 > 0 else ""
-                                
-                                result.append({
-                                    'busRouteId': str(item.get('routeId', '')),
-                                    'rtNm': item.get('routeName', ''),
-                                    'arrmsg1': arrmsg1,
-                                    'arrmsg2': arrmsg2,
-                                    'direction': item.get('routeDestName', ''),
-                                    'routeType': item.get('routeTypeCd', ''),
-                                    'arsId': station_id
-                                })
-                        else:
-                            pass
-                    else:
-                        pass
-                except Exception as e:
-                    print(f"⚠️ 경기도 API JSON 파싱 오류: {e}")
-            else:
-                print(f"❌ 경기도 API 요청 실패: {response.status_code}")
-
-        except Exception as e:
-            print(f"❌ 경기도 API 호출 중 오류: {e}")
-
-        return result
-
-    def get_bus_list(self, ars_id, db: Session = None):
-        """정류소 지나는 모든 버스노선 (DB location 확인 후 분기)"""
-        # DB에서 해당 정류소의 location 정보 확인
-        if db:
-            station = db.query(BusStation).filter(BusStation.ars_id == ars_id).first()
-            if station and station.location == 'SEL':
-                # location이 'SEL'인 경우 서울 버스 로직 사용
-                return self.get_bus_list_sel(ars_id)
-            elif station and station.location == 'KYG':
-                # location이 'KYG'인 경우 경기도 버스 로직 사용
-                return self.get_bus_list_kyg(ars_id)
+            # 결과는 카탈로그(id) 순이므로 커서 정류소 위치 다음부터 이어서 조회
+            start = 0
+            if after:
+                position = catalog.position(after)
+                if position is None:
+                    raise ValueError(f"검색 결과에 없는 커서입니다: {after}")
+                start = bisect_right(indices, position)
+            end = start + limit if limit is not None else None
+            return (catalog.record(i) for i in indices[start:end])
         
-        # 기본 로직 (location이 'SEL'이 아니거나 DB 정보가 없는 경우)
-        return self.get_bus_list_sel(ars_id)
-    
-    def parse_arrival_time(self, msg):
-        """도착시간 기준 정렬"""
-        if "곧 도착" in msg:
-            return 0
-        match = re.search(r"(\d+)분(\d+)초", msg)
-        if match:
-            minutes = int(match.group(1))
-            seconds = int(match.group(2))
-            return minutes * 60 + seconds
-        elif "분" in msg:  # "3분후" 같은 메시지
-            minutes = int(re.search(r"(\d+)분", msg).group(1))
-            return minutes * 60
-        elif "초" in msg:  # "20초후" 같은 메시지
-            seconds = int(re.search(r"(\d+)초", msg).group(1))
-            return seconds
-        else:
-            return 99999  # 도착 정보 없음 또는 운행 종료 등
+        # SQLite FTS5 색인으로 검색 (관련도 순, 멀티 워커 환경용)
+        rows = search_station_fts(db, name, after, limit)
+        return (
+            StationRecord(ars_id, station_name, longitude, latitude, None)
+            for ars_id, station_name, longitude, latitude in rows
+        )
     
     def setup_routes(self):
         """라우트 설정"""
         
         @self.router.get("/search")
-        async def search_station(name: str, db: Session = Depends(get_db)):
-            """정류소 이름으로 검색"""
+        async def search_station(
+            name: str,
+            after: Optional[str] = None,
+            limit: Optional[int] = Query(None, ge=1, le=settings.SEARCH_MAX_LIMIT),
+            format: str = Query("json", pattern="^(json|ndjson)$"),
+            db: Session = Depends(get_db)
+        ):
+            """정류소 이름으로 검색 (after: 직전 페이지 마지막 arsId, format=ndjson: 스트리밍)"""
             try:
-                # LIKE 검색으로 정류소 이름에 검색어가 포함된 정류소들 찾기
-                stations = db.query(BusStation).filter(
-                    BusStation.station_name.like(f"%{name}%")
-                ).all()
+                if format == "ndjson":
+                    # 한 줄에 정류소 하나씩, 여러 줄을 묶어 바로 내려보냄 (limit 미지정 시 전체)
+                    stations = self.search_stations(db, name, after, limit)
+                    return StreamingResponse(self.ndjson_chunks(stations), media_type="application/x-ndjson")
+                
+                # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+                limit = limit or settings.SEARCH_DEFAULT_LIMIT
+                stations = list(islice(self.search_stations(db, name, after, limit + 1), limit + 1))
+                next_cursor = stations[limit - 1].ars_id if len(stations) > limit else None
                 
                 if not stations:
-                    return {"success": False, "stations": []}
+                    return {"success": False, "stations": [], "next": None}
                 
-                return {
+                # 결과가 클 수 있으므로 jsonable_encoder 변환 없이 바로 직렬화
+                return ORJSONResponse({
                     "success": True,
-                    "stations": [
-                        {
-                            "stNm": station.station_name,
-                            "arsId": station.ars_id,
-                            "x": station.longitude,
-                            "y": station.latitude
-                        }
-                        for station in stations
-                    ]
-                }
+                    "stations": [self.station_to_dict(station) for station in stations[:limit]],
+                    "next": next_cursor
+                })
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
         
+        @self.router.get("/autocomplete")
+        async def autocomplete_station(
+            q: str,
+            limit: int = Query(10, ge=1, le=50),
+            db: Session = Depends(get_db)
+        ):
+            """정류소 이름 자동완성 (접두어 검색)"""
+            try:
+                return {"success": True, "suggestions": station_autocomplete.suggest(db, q, limit)}
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"자동완성 중 오류 발생: {str(e)}")
+        
         @self.router.get("/nearby")
         async def nearby_stations(ars_id: str, x: float, y: float, db: Session = Depends(get_db)):
             """주변 정류소 검색"""
             try:
-                # 모든 정류소 가져오기
-                all_stations = db.query(BusStation).all()
                 nearby = []
                 RADIUS_M = 300  # 300m 반경
                 
-                for station in all_stations:
-                    try:
-                        # 본인 정류소는 제외
-                        if station.ars_id == ars_id:
-                            continue
-                        
-                        # 거리 계산
-                        dist = self.haversine(y, x, station.latitude, station.longitude)
-                        if dist <= RADIUS_M:
-                            nearby.append({
-                                "stNm": station.station_name,
-                                "arsId": station.ars_id,
-                                "x": station.longitude,
-                                "y": station.latitude,
-                                "distance": round(dist, 3)
-                            })
-                    except Exception as e:
-                        print(f"정류소 {station.ars_id} 거리 계산 오류: {e}")
+                if settings.NEARBY_SEARCH_MODE == "sql":
+                    # DB 격자 셀 인덱스로 후보만 조회 (멀티 워커 환경용)
+                    catalog, indices, dists = query_radius_db(db, y, x, RADIUS_M)
+                else:
+                    # DB가 바뀌었으면 인덱스 재생성 후, 주변 격자 셀만 조회
+                    station_index.ensure_fresh(db)
+                    catalog = station_index.catalog
+                    indices, dists = station_index.query_radius(y, x, RADIUS_M)
+                for i, dist in zip(indices.tolist(), dists.tolist()):
+                    station = catalog.record(i)
+                    # 본인 정류소는 제외
+                    if station.ars_id == ars_id:
                         continue
+                    
+                    nearby.append({
+                        "stNm": station.station_name,
+                        "arsId": station.ars_id,
+                        "x": station.longitude,
+                        "y": station.latitude,
+                        "distance": round(dist, 3)
+                    })
                 
-                return {"success": True, "stations": nearby}
+                return ORJSONResponse({"success": True, "stations": nearby})
                 
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"주변 정류소 검색 중 오류 발생: {str(e)}")
         
-        @self.router.get("/arrival_info")
-        async def arrival_info(ars_id: str, db: Session = Depends(get_db)):
-            """정류소의 버스 도착 정보"""
+        @self.router.get("/knn")
+        async def nearest_stations(
+            x: float,
+            y: float,
+            k: int = Query(10, ge=1, le=100),
+            max_radius: float = Query(1000, gt=0, le=10000),
+            db: Session = Depends(get_db)
+        ):
+            """가장 가까운 정류소 k개 검색 (거리순)"""
             try:
-                arrivals = self.get_bus_list(ars_id, db)
+                station_index.ensure_fresh(db)
+                catalog = station_index.catalog
+                indices, dists = station_index.query_knn(y, x, k, max_radius)
                 
-                response_buses = []
-                for bus in arrivals:
-                    response_buses.append({
-                        "rtNm": bus["rtNm"],
-                        "arrmsg1": bus["arrmsg1"],
-                        "arrmsg2": bus["arrmsg2"],
-                        "direction": bus["direction"],
-                        "arsId": ars_id,
-                        "routeType": bus["routeType"],
-                        "busRouteId": bus["busRouteId"]
+                stations = []
+                for i, dist in zip(indices.tolist(), dists.tolist()):
+                    station = catalog.record(i)
+                    stations.append({
+                        "stNm": station.station_name,
+                        "arsId": station.ars_id,
+                        "x": station.longitude,
+                        "y": station.latitude,
+                        "distance": round(dist, 3)
                     })
                 
-                # 도착 시간 기준으로 정렬 (빠른 순서대로)
-                response_buses.sort(
-                    key=lambda x: self.parse_arrival_time(x["arrmsg1"])
-                )
+                return ORJSONResponse({"success": True, "stations": stations})
                 
-                return {"success": True, "buses": response_buses}
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"최근접 정류소 검색 중 오류 발생: {str(e)}")
+        
+        @self.router.get("/tiles/{z}/{x}/{y}")
+        async def station_tile(
+            z: int,
+            x: int,
+            y: int,
+            db: Session = Depends(get_db),
+            if_none_match: Optional[str] = Header(None)
+        ):
+            """지도 타일(z/x/y) 안의 정류소 목록"""
+            if not MIN_TILE_ZOOM <= z <= MAX_TILE_ZOOM:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"타일 줌 레벨은 {MIN_TILE_ZOOM}~{MAX_TILE_ZOOM} 사이여야 합니다"
+                )
+            if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+                raise HTTPException(status_code=400, detail="타일 좌표가 범위를 벗어났습니다")
+            
+            try:
+                body, etag = station_tile_cache.get_tile(db, z, x, y)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"정류소 타일 조회 중 오류 발생: {str(e)}")
+            
+            headers = {
+                "ETag": etag,
+                "Cache-Control": f"public, max-age={TILE_MAX_AGE}"
+            }
+            # 클라이언트가 가진 타일과 같으면 본문 없이 304 응답
+            # 압축된 응답의 ETag("...-br", "...-gzip")나 약한 비교(W/)로 보낸 태그도 같은 타일로 인정
+            if if_none_match:
+                for tag in if_none_match.split(","):
+                    if etag_base(tag) == etag:
+                        # 304에는 클라이언트가 가진 표현의 ETag를 그대로 돌려줌
+                        headers["ETag"] = tag.strip()
+                        return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+        
+        @self.router.get("/clusters")
+        async def station_clusters(
+            z: int,
+            south: Optional[float] = None,
+            west: Optional[float] = None,
+            north: Optional[float] = None,
+            east: Optional[float] = None,
+            db: Session = Depends(get_db)
+        ):
+            """축소된 지도용 정류소 클러스터 (개수, 중심, 범위)"""
+            if not MIN_CLUSTER_ZOOM <= z <= MAX_CLUSTER_ZOOM:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"클러스터 줌 레벨은 {MIN_CLUSTER_ZOOM}~{MAX_CLUSTER_ZOOM} 사이여야 합니다"
+                )
+            
+            try:
+                clusters = station_cluster_index.get_clusters(db, z, south, west, north, east)
+                return {"success": True, "z": z, "clusters": clusters}
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"정류소 클러스터 조회 중 오류 발생: {str(e)}")
+        
+        @self.router.get("/arrival_info")
+        async def arrival_info(ars_id: str, response: Response, db: Session = Depends(get_db)):
+            """정류소의 버스 도착 정보 (캐시된 정보면 age에 경과 시간 표시)"""
+            try:
+                arrivals, location, age = await self.get_bus_list_with_age(ars_id, db, settings.ARRIVAL_SWR_MAX_STALE)
+                # 데이터 경과 시간 (HTTP Age 헤더와 응답 본문 모두에 표시)
+                response.headers["Age"] = str(int(age))
+                return {
+                    "success": True,
+                    "buses": self.arrivals_to_response(arrivals),
+                    "age": round(age, 1),
+                    "stale": age > provider_registry.get(location).arrival_ttl
+                }
 
+            except UpstreamError as e:
+                raise HTTPException(status_code=503, detail=f"버스 정보 서버 응답 지연으로 잠시 후 다시 시도해주세요 ({str(e)})")
             except Exception as e:
                 print(f"❌ /arrival_info 처리 중 오류 발생: {e}")
-                raise HTTPException(status_code=500, detail=f"도착 정보 조회 중 오류 발생: {str(e)}") 
\ No newline at end of file
+                raise HTTPException(status_code=500, detail=f"도착 정보 조회 중 오류 발생: {str(e)}")
+
+        @self.router.post("/arrival_info/batch")
+        async def arrival_info_batch(request: ArrivalBatchRequest, db: Session = Depends(get_db)):
+            """여러 정류소의 버스 도착 정보 일괄 조회 (정류소별 오류는 해당 항목에만 표시)"""
+            # 중복 제거 (요청 순서 유지)
+            ars_ids = list(dict.fromkeys(ars_id.strip() for ars_id in request.ars_ids if ars_id.strip()))
+            if len(ars_ids) > settings.ARRIVAL_BATCH_MAX_SIZE:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"한 번에 조회할 수 있는 정류소는 최대 {settings.ARRIVAL_BATCH_MAX_SIZE}개입니다"
+                )
+
+            try:
+                results = await self.get_bus_lists(ars_ids, db)
+            except Exception as e:
+                print(f"❌ /arrival_info/batch 처리 중 오류 발생: {e}")
+                raise HTTPException(status_code=500, detail=f"도착 정보 조회 중 오류 발생: {str(e)}")
+
+            stations = []
+            for ars_id in ars_ids:
+                arrivals = results[ars_id]
+                if isinstance(arrivals, Exception):
+                    print(f"⚠️ 정류소 {ars_id} 도착 정보 조회 실패: {arrivals}")
+                    stations.append({"arsId": ars_id, "success": False, "error": str(arrivals) or type(arrivals).__name__})
+                else:
+                    stations.append({"arsId": ars_id, "success": True, "buses": self.arrivals_to_response(arrivals)})
+            return {"success": True, "stations": stations}
+
+        @self.router.websocket("/arrival_stream")
+        async def arrival_stream(websocket: WebSocket):
+            """실시간 도착 정보 구독 (WebSocket, 구독한 정류소의 도착 정보가 바뀔 때만 전달)"""
+            await websocket.accept()
+            subscriber = ArrivalSubscriber()
+
+            async def receive():
+                while True:
+                    text = await websocket.receive_text()
+                    try:
+                        request = json.loads(text)
+                    except ValueError:
+                        request = None
+                    try:
+                        unknown = self.update_stream_subscription(subscriber, request)
+                        for ars_id in unknown:
+                            subscriber.push({"type": "error", "arsId": ars_id, "error": "존재하지 않는 정류소입니다"})
+                    except ValueError as e:
+                        # 잘못된 요청은 연결을 끊지 않고 오류 메시지로 응답
+                        subscriber.push({"type": "error", "arsId": None, "error": str(e)})
+
+            async def send():
+                while True:
+                    for message in await subscriber.next_messages():
+                        await websocket.send_text(json.dumps(message, ensure_ascii=False))
+
+            # 클라이언트 연결이 끊기면(receive 종료) 전송도 중지
+            tasks = [asyncio.create_task(receive()), asyncio.create_task(send())]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                arrival_hub.unsubscribe(subscriber)
+
+        @self.router.get("/cache_stats")
+        async def cache_stats():
+            """외부 API 캐시 사용 통계 (적중/미스/합쳐진 요청 수)"""
+            return {
+                "success": True,
+                "arrival": arrival_cache.stats(),
+                "routes": route_cache.stats(),
+                "prefetch": arrival_prefetcher.stats(),
+                "upstream": upstream_clients.stats(),
+                "providers": provider_registry.stats(),
+                "stream": arrival_hub.stats()
+            }
+
+        @self.router.delete("/route_cache")
+        async def invalidate_route_cache(ars_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
+            """정류소 노선 목록 캐시 삭제 (관리자 전용, ars_id가 없으면 전체, 다음 조회 때 다시 받아옴)"""
+            # 전체 삭제 시 모든 정류소를 호출 한도가 있는 외부 API에서 다시 받아야 하므로 관리자만 허용
+            if not current_user.is_superuser:
+                raise HTTPException(status_code=403, detail="관리자만 캐시를 삭제할 수 있습니다")
+            deleted = route_cache.invalidate(ars_id)
+            if ars_id is None:
+                arrival_cache.invalidate()
+            else:
+                for location in provider_registry.codes():
+                    arrival_cache.invalidate((location, ars_id))
+            return {"success": True, "deleted": deleted} 
\ No newline at end of file
@@ -1,10 +1,13 @@
 from .base_router import BaseRouter
 from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.database.connection import get_db
 from app.models.saved_route_model import SavedRoute
 from app.models.user_model import User
 from app.models.bus_station_model import BusStation
+from app.services.arrival_record import format_arrival
+from app.services.bus_providers import provider_registry
 from app.utils.auth import get_current_user
 from typing import List, Dict, Any, Optional
 
@@ -257,17 +260,22 @@ class SavedRoutesRouter(BaseRouter):
                     BusStation, SavedRoute.ars_id == BusStation.ars_id
                 ).filter(SavedRoute.user_id == user_id).all()
                 
+                # 즐겨찾기한 정류소들의 도착정보를 한 번에 동시 조회 (정류소 location의 지역 제공자 사용)
+                arrival_lists = await provider_registry.get_bus_lists(
+                    {saved_route.ars_id: station.location for saved_route, station in saved_routes}
+                )
+                
                 result = []
                 for saved_route, station in saved_routes:
-                    # 도착정보 가져오기 (서울/경기도 구분)
-                    from .bus_station_router import BusStationRouter
-                    bus_router = BusStationRouter()
-                    arrival_info = bus_router.get_bus_list(saved_route.ars_id, db)
+                    arrival_info = arrival_lists[saved_route.ars_id]
+                    if isinstance(arrival_info, Exception):
+                        print(f"⚠️ 정류소 {saved_route.ars_id} 도착 정보 조회 실패: {arrival_info}")
+                        arrival_info = []
                     
                     # 해당 버스의 도착정보 찾기 (route_id로 매칭)
                     matched_bus = None
                     if saved_route.route_id:
-                        matched_bus = next((bus for bus in arrival_info if bus.get('busRouteId') == saved_route.route_id), None)
+                        matched_bus = next((bus for bus in arrival_info if bus.bus_route_id == saved_route.route_id), None)
                     
                     result.append({
                         "arsId": saved_route.ars_id,
@@ -275,15 +283,17 @@ class SavedRoutesRouter(BaseRouter):
                         "stationName": station.station_name,
                         "longitude": station.longitude,
                         "latitude": station.latitude,
-                        "arrmsg1": matched_bus['arrmsg1'] if matched_bus else "정보 없음",
-                        "arrmsg2": matched_bus['arrmsg2'] if matched_bus else "",
-                        "direction": matched_bus['direction'] if matched_bus else ""
+                        "arrmsg1": format_arrival(matched_bus.eta1, matched_bus.stops1, matched_bus.status1, matched_bus.note1) if matched_bus else "정보 없음",
+                        "arrmsg2": format_arrival(matched_bus.eta2, matched_bus.stops2, matched_bus.status2, matched_bus.note2) if matched_bus else "",
+                        "direction": matched_bus.direction if matched_bus else "",
+                        "eta1": matched_bus.eta1 if matched_bus else None
                     })
                 
-                return {
+                # 목록이 클 수 있으므로 jsonable_encoder 변환 없이 바로 직렬화
+                return ORJSONResponse({
                     "success": True,
                     "savedRoutes": result
-                }
+                })
                 
             except HTTPException:
                 raise
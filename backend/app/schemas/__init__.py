@@ -4,9 +4,11 @@ from .user_schema import (
     UserBase, UserCreate, UserUpdate, UserLogin, 
     UserResponse, Token, TokenData
 )
+from .bus_station_schema import ArrivalBatchRequest
 
 __all__ = [
     "BaseSchema", "BaseResponse",
     "UserBase", "UserCreate", "UserUpdate", "UserLogin", 
-    "UserResponse", "Token", "TokenData"
+    "UserResponse", "Token", "TokenData",
+    "ArrivalBatchRequest"
 ] 
\ No newline at end of file
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from typing import List
+
+class ArrivalBatchRequest(BaseModel):
+    """여러 정류소 도착 정보 일괄 조회 요청 스키마"""
+    
+    ars_ids: List[str]
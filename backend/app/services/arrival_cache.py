@@ -0,0 +1,190 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from config import settings
+from .upstream_client import UpstreamError, UpstreamPartialError
+from .upstream_quota import upstream_priority, PRIORITY_BACKGROUND
+
+class ArrivalCache:
+    """도착 정보 캐시 (TTL + LRU, 같은 키의 동시 요청은 외부 API 호출 1번으로 합침)"""
+
+    def __init__(
+        self,
+        ttl: float = settings.ARRIVAL_CACHE_TTL,
+        max_size: int = settings.ARRIVAL_CACHE_MAX_SIZE,
+        max_stale: float = settings.ARRIVAL_CACHE_MAX_STALE
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_stale = max_stale
+        # 키 -> (저장 시각, 값, TTL)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, float]]" = OrderedDict()
+        # 키 -> (진행 중인 조회 작업, 그 작업의 외부 API 호출 우선순위)
+        self._inflight: Dict[Hashable, Tuple[asyncio.Future, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.stale_served = 0
+        self.stale_hits = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 캐시 값 (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value, ttl = entry
+        if time.monotonic() - stored_at > ttl:
+            # 만료된 항목도 외부 API 장애 대비용으로 LRU에서 밀려날 때까지 보관
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """만료됐더라도 max_stale 이내의 캐시 값 (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.max_stale:
+            return None
+        return entry[1]
+
+    def age(self, key: Hashable, value: Any) -> float:
+        """캐시에 저장된 value의 경과 시간 (단위: 초, 방금 받아온 값이거나 캐시에 없으면 0)"""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is not value:
+            return 0.0
+        return time.monotonic() - entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """캐시 저장 (ttl이 없으면 기본 TTL, 최대 개수를 넘으면 가장 오래 안 쓴 항목 제거)"""
+        self._entries[key] = (time.monotonic(), value, self.ttl if ttl is None else ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """캐시 항목 삭제 (key가 없으면 전체)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch_with_age(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        max_stale: float = 0.0,
+        ttl: Optional[float] = None
+    ) -> Tuple[Any, float]:
+        """캐시에 있으면 바로 반환, 없으면 fetch 실행 (진행 중인 같은 키 조회가 있으면 그 결과를 공유), 값의 경과 시간(단위: 초)도 함께 반환
+
+        max_stale > 0 이면 stale-while-revalidate: TTL이 지났어도 max_stale 이내의 값은 바로 반환하고
+        갱신은 백그라운드에서 진행.
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value, self.age(key, value)
+
+        if max_stale > 0:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= max_stale:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self.refresh_in_background(key, fetch, ttl)
+                return entry[1], time.monotonic() - entry[0]
+
+        task = self._join(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._start(key, fetch, ttl)
+
+        # 먼저 요청한 클라이언트가 끊겨도 조회는 계속 진행
+        value = await asyncio.shield(task)
+        # 외부 API 장애로 이전 값을 받은 경우 그 값의 경과 시간
+        return value, self.age(key, value)
+
+    def refresh_in_background(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None):
+        """응답을 기다리지 않고 다시 조회 (이미 조회 중이면 무시)"""
+        if key in self._inflight:
+            return
+
+        async def background_refresh():
+            # 이미 응답한 요청의 갱신이므로 사용자 요청보다 낮은 우선순위로 호출 한도 사용
+            upstream_priority.set(PRIORITY_BACKGROUND)
+            return await self.refresh(key, fetch, ttl)
+
+        task = asyncio.ensure_future(background_refresh())
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """캐시 여부와 관계없이 다시 조회해서 저장 (진행 중인 같은 키 조회가 있으면 그 결과 사용)"""
+        task = self._join(key)
+        if task is None:
+            self.refreshes += 1
+            task = self._start(key, fetch, ttl)
+        return await asyncio.shield(task)
+
+    def _join(self, key: Hashable) -> Optional[asyncio.Future]:
+        """합류할 수 있는 같은 키의 진행 중인 조회 (없으면 None)
+
+        사용자 요청이 백그라운드 조회에 합류하면 낮은 우선순위로 호출 한도를 기다리다 거절될 수 있으므로
+        현재 작업보다 우선순위가 낮은 조회에는 합류하지 않음.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight[1] > upstream_priority.get():
+            return None
+        return inflight[0]
+
+    def _start(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> asyncio.Future:
+        """현재 작업의 우선순위로 조회 시작 (이후 같은 키 요청은 이 조회에 합류)"""
+        task = asyncio.ensure_future(self._fetch(key, fetch, ttl))
+        self._inflight[key] = (task, upstream_priority.get())
+        return task
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """조회 후 캐시에 저장 (실패한 조회는 저장하지 않고, 외부 API 장애면 이전 값으로 응답)"""
+        try:
+            value = await fetch()
+            self.set(key, value, ttl)
+            return value
+        except UpstreamError as e:
+            stale = self.get_stale(key)
+            if stale is not None:
+                self.stale_served += 1
+                print(f"⚠️ 외부 API 장애로 이전 도착 정보 사용 ({key}): {e}")
+                return stale
+            if isinstance(e, UpstreamPartialError):
+                # 이전 값이 없으면 일부 결과로 응답 (캐시에는 저장하지 않아 다음 요청에서 다시 조회)
+                return e.partial
+            raise
+        finally:
+            # 더 높은 우선순위의 조회가 뒤이어 시작됐으면 그 조회는 남겨 둠
+            inflight = self._inflight.get(key)
+            if inflight is not None and inflight[0] is asyncio.current_task():
+                del self._inflight[key]
+
+    def stats(self) -> dict:
+        """캐시 사용 통계 (튜닝용)"""
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "ttl": self.ttl,
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "staleHits": self.stale_hits,
+            "staleServed": self.stale_served,
+            "hitRate": round((self.hits + self.stale_hits + self.coalesced) / lookups, 4) if lookups else 0.0
+        }
+
+# 전역 도착 정보 캐시 인스턴스
+arrival_cache = ArrivalCache()
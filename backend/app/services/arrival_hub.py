@@ -0,0 +1,126 @@
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from .arrival_record import arrival_sort_key, record_to_dict
+from .bus_providers import ProviderRegistry, provider_registry
+from config import settings
+
+# (지역 코드, ars_id)
+StationKey = Tuple[str, str]
+
+class ArrivalSubscriber:
+    """실시간 도착 정보 구독자 (연결 하나), 아직 보내지 못한 정류소별 최신 메시지만 보관"""
+
+    def __init__(self):
+        self.stations: Set[StationKey] = set()
+        # 느린 클라이언트는 중간 변경을 건너뛰고 정류소별 마지막 상태만 받음
+        self._pending: "OrderedDict[str, dict]" = OrderedDict()
+        self._ready = asyncio.Event()
+
+    def push(self, message: dict):
+        """보낼 메시지 추가 (같은 정류소의 이전 메시지는 대체)"""
+        self._pending.pop(message["arsId"], None)
+        self._pending[message["arsId"]] = message
+        self._ready.set()
+
+    async def next_messages(self) -> List[dict]:
+        """보낼 메시지가 생길 때까지 기다렸다가 모두 꺼냄"""
+        await self._ready.wait()
+        self._ready.clear()
+        messages = list(self._pending.values())
+        self._pending.clear()
+        return messages
+
+class ArrivalHub:
+    """구독된 정류소를 구독자 수와 관계없이 정류소당 하나의 작업으로 주기 조회하고, 바뀐 경우에만 구독자에게 전달"""
+
+    def __init__(self, registry: ProviderRegistry, interval: float = settings.ARRIVAL_STREAM_INTERVAL):
+        self.registry = registry
+        self.interval = interval
+        self._watchers: Dict[StationKey, Set[ArrivalSubscriber]] = {}
+        self._pollers: Dict[StationKey, asyncio.Task] = {}
+        # 정류소별 마지막으로 보낸 메시지 (새 구독자에게 바로 전달)
+        self._last: Dict[StationKey, dict] = {}
+        self.polls = 0
+        self.pushes = 0
+        self.failures = 0
+
+    def subscribe(self, subscriber: ArrivalSubscriber, location: str, ars_id: str):
+        """정류소 구독 (처음 구독된 정류소면 조회 작업 시작)"""
+        key = (self.registry.resolve(location), ars_id)
+        subscriber.stations.add(key)
+        self._watchers.setdefault(key, set()).add(subscriber)
+        if key in self._last:
+            subscriber.push(self._last[key])
+        if key not in self._pollers:
+            self._pollers[key] = asyncio.create_task(self._poll(key))
+
+    def unsubscribe(self, subscriber: ArrivalSubscriber, ars_id: Optional[str] = None):
+        """정류소 구독 해제 (ars_id가 없으면 전체), 구독자가 없는 정류소는 조회 중지"""
+        for key in [key for key in subscriber.stations if ars_id is None or key[1] == ars_id]:
+            subscriber.stations.discard(key)
+            watchers = self._watchers.get(key)
+            if watchers is None:
+                continue
+            watchers.discard(subscriber)
+            if not watchers:
+                del self._watchers[key]
+                self._last.pop(key, None)
+                task = self._pollers.pop(key, None)
+                if task is not None:
+                    task.cancel()
+
+    async def _poll(self, key: StationKey):
+        """정류소 하나를 주기적으로 조회해 이전과 달라졌으면 구독자 전원에게 전달"""
+        location, ars_id = key
+        previous = None
+        while key in self._watchers:
+            self.polls += 1
+            try:
+                # 도착 정보 캐시를 거치므로 같은 정류소를 일반 조회한 결과도 함께 사용
+                arrivals, age = await self.registry.get_bus_list(location, ars_id)
+                # 경과 시간은 매번 달라지므로 변경 여부는 도착 정보만으로 비교
+                snapshot = sorted(arrivals, key=arrival_sort_key)
+                message = {
+                    "type": "arrivals",
+                    "arsId": ars_id,
+                    "buses": [record_to_dict(record) for record in snapshot],
+                    "age": round(age, 1)
+                }
+            except Exception as e:
+                self.failures += 1
+                error = str(e) or type(e).__name__
+                snapshot = error
+                message = {"type": "error", "arsId": ars_id, "error": error}
+
+            if snapshot != previous and key in self._watchers:
+                previous = snapshot
+                self._last[key] = message
+                for subscriber in self._watchers[key]:
+                    subscriber.push(message)
+                    self.pushes += 1
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        """모든 조회 작업 중지 (애플리케이션 종료 시)"""
+        tasks = list(self._pollers.values())
+        self._pollers.clear()
+        self._watchers.clear()
+        self._last.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """구독 통계 (외부 API 조회는 구독자 수가 아니라 정류소 수에 비례)"""
+        return {
+            "stations": len(self._pollers),
+            "subscriptions": sum(len(watchers) for watchers in self._watchers.values()),
+            "interval": self.interval,
+            "polls": self.polls,
+            "pushes": self.pushes,
+            "failures": self.failures
+        }
+
+# 전역 실시간 도착 정보 구독 관리 인스턴스
+arrival_hub = ArrivalHub(provider_registry)
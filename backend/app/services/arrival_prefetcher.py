@@ -0,0 +1,140 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy import func
+from ..database.connection import SessionLocal
+from ..models.bus_station_model import BusStation
+from ..models.saved_route_model import SavedRoute
+from .upstream_quota import upstream_priority, PRIORITY_BACKGROUND
+from config import settings
+
+# (지역 코드, ars_id) -> 외부 API로 다시 조회해 도착 정보 캐시에 저장 (provider_registry.refresh_bus_list)
+BusListRefresher = Callable[[str, str], Awaitable[list]]
+
+class PrefetchStation:
+    """미리 갱신할 정류소 (저장한 사용자 수가 많을수록 자주 갱신)"""
+
+    __slots__ = ("ars_id", "location", "users", "next_due")
+
+    def __init__(self, ars_id: str, location: str, users: int, next_due: float):
+        self.ars_id = ars_id
+        self.location = location
+        self.users = users
+        self.next_due = next_due
+
+class ArrivalPrefetcher:
+    """즐겨찾기 정류소의 도착 정보를 주기적으로 조회해 도착 정보 캐시를 채워두는 스케줄러"""
+
+    def __init__(self):
+        self.refresh: Optional[BusListRefresher] = None
+        self._stations: Dict[str, PrefetchStation] = {}
+        self._loaded_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.refreshed = 0
+        self.failures = 0
+
+    def interval_for(self, users: int) -> float:
+        """정류소 갱신 간격 (저장한 사용자 수에 반비례)"""
+        return max(settings.ARRIVAL_PREFETCH_MIN_INTERVAL, settings.ARRIVAL_PREFETCH_MAX_INTERVAL / max(users, 1))
+
+    def load_hot_stations(self):
+        """즐겨찾기된 정류소 목록 (사용자 수 많은 순) 다시 읽기"""
+        db = SessionLocal()
+        try:
+            users = func.count(func.distinct(SavedRoute.user_id))
+            rows = db.query(SavedRoute.ars_id, BusStation.location, users) \
+                .outerjoin(BusStation, BusStation.ars_id == SavedRoute.ars_id) \
+                .group_by(SavedRoute.ars_id, BusStation.location) \
+                .order_by(users.desc(), SavedRoute.ars_id) \
+                .limit(settings.ARRIVAL_PREFETCH_MAX_STATIONS) \
+                .all()
+        finally:
+            db.close()
+
+        now = time.monotonic()
+        stations = {}
+        for ars_id, location, count in rows:
+            previous = self._stations.get(ars_id)
+            stations[ars_id] = PrefetchStation(
+                ars_id,
+                # 지역 코드는 refresh에서 등록된 지역으로 정리
+                location,
+                count,
+                # 새로 추가된 정류소는 바로 갱신
+                previous.next_due if previous else now
+            )
+        self._stations = stations
+        self._loaded_at = now
+
+    async def refresh_station(self, station: PrefetchStation):
+        """정류소 하나의 도착 정보를 다시 조회해 캐시에 저장"""
+        try:
+            await asyncio.wait_for(
+                self.refresh(station.location, station.ars_id),
+                settings.UPSTREAM_CALL_TIMEOUT * 2
+            )
+            self.refreshed += 1
+        except Exception as e:
+            self.failures += 1
+            print(f"⚠️ 정류소 {station.ars_id} 도착 정보 미리 갱신 실패: {e}")
+
+    async def run_once(self) -> int:
+        """갱신 시간이 된 정류소들 조회 (사용자 수 많은 정류소 먼저), 조회한 정류소 수 반환"""
+        now = time.monotonic()
+        if now - self._loaded_at >= settings.ARRIVAL_PREFETCH_RELOAD_SECONDS:
+            self.load_hot_stations()
+
+        due = [station for station in self._stations.values() if station.next_due <= now]
+        if not due:
+            return 0
+        due.sort(key=lambda station: (-station.users, station.next_due))
+        for station in due:
+            station.next_due = now + self.interval_for(station.users)
+
+        semaphore = asyncio.Semaphore(settings.ARRIVAL_PREFETCH_CONCURRENCY)
+
+        async def refresh(station: PrefetchStation):
+            async with semaphore:
+                await self.refresh_station(station)
+
+        await asyncio.gather(*(refresh(station) for station in due))
+        return len(due)
+
+    async def _run(self):
+        """주기적으로 갱신 시간이 된 정류소 조회"""
+        # 미리 갱신은 사용자 요청보다 낮은 우선순위로 호출 한도 사용
+        upstream_priority.set(PRIORITY_BACKGROUND)
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"⚠️ 도착 정보 미리 갱신 오류: {e}")
+            await asyncio.sleep(settings.ARRIVAL_PREFETCH_TICK)
+
+    def start(self, refresh: BusListRefresher):
+        """백그라운드 갱신 시작 (애플리케이션 시작 시)"""
+        self.refresh = refresh
+        if self._task is None and settings.ARRIVAL_PREFETCH_ENABLED:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """백그라운드 갱신 중지 (애플리케이션 종료 시)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict:
+        """미리 갱신 통계"""
+        return {
+            "enabled": self._task is not None,
+            "stations": len(self._stations),
+            "refreshed": self.refreshed,
+            "failures": self.failures
+        }
+
+# 전역 도착 정보 미리 갱신 스케줄러 인스턴스
+arrival_prefetcher = ArrivalPrefetcher()
@@ -0,0 +1,98 @@
+import re
+from collections import namedtuple
+from typing import Optional, Tuple
+
+# 지역(SEL/KYG) 공통 도착 정보 (도착 예정 시간은 초, 남은 정류장 수는 정수로 보관)
+# eta가 None이면 status에 "운행종료", "도착 정보 없음" 같은 상태 문구를 보관
+# note: 도착 메시지 앞의 표시 ("[막차]", "[첫차]", "[회차지]"의 괄호 안 문구, 없으면 None)
+ArrivalRecord = namedtuple(
+    "ArrivalRecord",
+    [
+        "bus_route_id", "route_name", "route_type", "direction", "ars_id",
+        "eta1", "stops1", "status1",
+        "eta2", "stops2", "status2",
+        "note1", "note2"
+    ],
+    defaults=(None, None)
+)
+
+# 이 시간(초) 이하로 남으면 "곧 도착"으로 표시
+SOON_SECONDS = 60
+# 도착 예정 시간이 없는 버스의 정렬 키
+NO_ETA = 99999
+
+_MINUTES_SECONDS = re.compile(r"(\d+)분(?:(\d+)초)?")
+_SECONDS = re.compile(r"(\d+)초")
+_STOPS = re.compile(r"\[(\d+)번째 전\]")
+_NOTE = re.compile(r"^\s*\[([^\]]+)\]\s*")
+
+def to_int(value) -> Optional[int]:
+    """외부 API 숫자 필드 변환 (빈 문자열, None, 0 이하는 None)"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+def parse_arrival_msg(msg: str, tra_time=None) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[str]]:
+    """서울 API 도착 메시지 -> (도착 예정 초, 남은 정류장 수, 상태 문구, 앞 표시), 수신 시 한 번만 파싱"""
+    msg = msg or ""
+    # "[막차] 5분후[3번째 전]" 같은 앞 표시는 따로 보관했다가 표시 문구를 만들 때 다시 붙임
+    note = None
+    note_match = _NOTE.match(msg)
+    if note_match:
+        note = note_match.group(1)
+    stops_match = _STOPS.search(msg)
+    stops = int(stops_match.group(1)) if stops_match else None
+    if "곧 도착" in msg:
+        return 0, stops, None, note
+
+    eta = None
+    match = _MINUTES_SECONDS.search(msg)
+    if match:
+        eta = int(match.group(1)) * 60 + int(match.group(2) or 0)
+    else:
+        match = _SECONDS.search(msg)
+        if match:
+            eta = int(match.group(1))
+    if eta is None:
+        # 운행종료, 출발대기, 회차대기 등 (앞 표시도 원문 그대로 status에 포함)
+        return None, None, msg, None
+    # 메시지보다 정확한 예상 시간(traTime)이 있으면 사용
+    return to_int(tra_time) or eta, stops, None, note
+
+def format_arrival(eta: Optional[int], stops: Optional[int], status: Optional[str], note: Optional[str] = None) -> str:
+    """표시용 도착 메시지 (응답 직렬화 시에만 생성)"""
+    if eta is None:
+        return status or ""
+    if eta <= SOON_SECONDS:
+        text = "곧 도착"
+    else:
+        minutes, seconds = divmod(eta, 60)
+        text = f"{minutes}분{seconds}초후" if seconds else f"{minutes}분후"
+        if stops:
+            text += f"[{stops}번째 전]"
+    # 막차/첫차 등 앞 표시
+    return f"[{note}] {text}" if note else text
+
+def arrival_sort_key(record: ArrivalRecord) -> int:
+    """도착 시간 기준 정렬 키 (빠른 순, 정보 없으면 맨 뒤)"""
+    return NO_ETA if record.eta1 is None else record.eta1
+
+def record_to_dict(record: ArrivalRecord) -> dict:
+    """도착 정보 응답 형식 (표시 문구 + 숫자 필드)"""
+    return {
+        "rtNm": record.route_name,
+        "arrmsg1": format_arrival(record.eta1, record.stops1, record.status1, record.note1),
+        "arrmsg2": format_arrival(record.eta2, record.stops2, record.status2, record.note2),
+        "direction": record.direction,
+        "arsId": record.ars_id,
+        "routeType": record.route_type,
+        "busRouteId": record.bus_route_id,
+        "eta1": record.eta1,
+        "eta2": record.eta2,
+        "stopsAway1": record.stops1,
+        "stopsAway2": record.stops2,
+        "note1": record.note1,
+        "note2": record.note2
+    }
@@ -0,0 +1,409 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+import httpx
+from config import settings
+from .arrival_cache import ArrivalCache, arrival_cache
+from ..database.connection import SessionLocal
+from ..models.bus_station_model import BusStation
+from .arrival_record import ArrivalRecord, parse_arrival_msg, to_int
+from .route_cache import route_cache
+from .upstream_client import upstream_clients, UpstreamError, UpstreamPartialError, UpstreamUnavailable
+
+# 경기도 API 요청 헤더
+KYG_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json, text/xml, */*',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Cache-Control': 'no-cache'
+}
+
+class BusProvider:
+    """지역 버스 API 제공자 기본 클래스
+
+    지역마다 외부 API 연결 풀, 동시 호출 제한, 도착 정보 캐시 TTL을 따로 가짐.
+    새 지역은 이 클래스를 상속해 fetch_arrivals를 구현하고 provider_registry.register로 등록.
+    """
+
+    # 지역 코드 (bus_stations.location 값)
+    code = ""
+    name = ""
+
+    def __init__(
+        self,
+        base_url: str,
+        concurrency: int,
+        arrival_ttl: float,
+        max_connections: int,
+        headers: Optional[dict] = None,
+        verify: bool = True
+    ):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.arrival_ttl = arrival_ttl
+        self.max_connections = max_connections
+        self.headers = headers
+        self.verify = verify
+        self.api_key = settings.DECODED_DATA_API_KEY
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+
+    async def request(self, path: str, params: dict, deadline: float) -> httpx.Response:
+        """이 지역 연결 풀로 외부 API 호출 (재시도/회로 차단기/호출 한도 적용)"""
+        return await upstream_clients.request(self.code, path, params, deadline=deadline)
+
+    async def call_with_timeout(self, coro, name, timeout=None):
+        """외부 API 호출 (시간 초과는 UpstreamError로 변환)"""
+        try:
+            return await asyncio.wait_for(coro, timeout or settings.UPSTREAM_CALL_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise UpstreamError(f"{self.code} {name} 요청 시간 초과")
+
+    async def fetch_arrivals(self, ars_id: str) -> List[ArrivalRecord]:
+        """정류소 도착 정보 조회 + 파싱 (지역별 구현)"""
+        raise NotImplementedError
+
+    async def get_routes_by_station(self, ars_id: str) -> List[dict]:
+        """정류소 경유 노선 목록 (노선 목록 API가 없는 지역은 빈 목록)"""
+        return []
+
+    async def fetch_bus_list(self, ars_id: str) -> List[ArrivalRecord]:
+        """동시 호출 제한 안에서 도착 정보 조회 (자리가 없으면 PROVIDER_QUEUE_TIMEOUT 동안 대기)"""
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), settings.PROVIDER_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise UpstreamUnavailable(f"{self.code} API 동시 호출 한도 초과")
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self.calls += 1
+        start = time.perf_counter()
+        try:
+            return await self.fetch_arrivals(ars_id)
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.total_ms += (time.perf_counter() - start) * 1000
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        """지역별 호출 통계"""
+        return {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "inFlight": self.in_flight,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "avgMs": round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            "arrivalTtl": self.arrival_ttl
+        }
+
+class SeoulBusProvider(BusProvider):
+    """서울 버스 API (ws.bus.go.kr): 경유 노선 목록(DB 캐시) + 실시간 도착 정보"""
+
+    code = "SEL"
+    name = "서울"
+
+    def __init__(self):
+        super().__init__(
+            base_url=settings.SEL_API_BASE_URL,
+            concurrency=settings.SEL_CONCURRENCY,
+            arrival_ttl=settings.SEL_ARRIVAL_TTL,
+            max_connections=settings.SEL_MAX_CONNECTIONS
+        )
+        self.route_ttl = settings.SEL_ROUTE_TTL
+
+    def parse_arrivals(self, data: dict, ars_id: str) -> List[ArrivalRecord]:
+        """getStationByUid 응답 -> 도착 정보 (도착 메시지는 여기서 한 번만 숫자로 변환)"""
+        # 도착 정보가 없는 정류소는 itemList가 null로 옴
+        item_list = data['msgBody'].get('itemList') or []
+        if isinstance(item_list, dict):
+            item_list = [item_list]
+
+        result = []
+        for item in item_list:
+            # traTime: 예상 도착 초
+            eta1, stops1, status1, note1 = parse_arrival_msg(item['arrmsg1'], item.get('traTime1'))
+            eta2, stops2, status2, note2 = parse_arrival_msg(item['arrmsg2'], item.get('traTime2'))
+            result.append(ArrivalRecord(
+                bus_route_id=item['busRouteId'],
+                route_name=item['rtNm'],
+                route_type=item.get('routeType', ''),
+                direction=item['adirection'],
+                ars_id=ars_id,
+                eta1=eta1, stops1=stops1, status1=status1,
+                eta2=eta2, stops2=stops2, status2=status2,
+                note1=note1, note2=note2
+            ))
+        return result
+
+    def parse_routes(self, data: dict) -> List[dict]:
+        """getRouteByStation 응답 -> 노선 목록"""
+        item_list = data.get('msgBody', {}).get('itemList', [])
+        # None인 경우 빈 리스트로 처리
+        if item_list is None:
+            item_list = []
+        # 하나만 올 경우 dict → list
+        if isinstance(item_list, dict):
+            item_list = [item_list]
+        return item_list
+
+    async def get_arrival_info_by_ars_id(self, ars_id: str) -> List[ArrivalRecord]:
+        """정류소ID -> 정류소 도착 노선ID, 이름,노선유형, 도착정보"""
+        params = {
+            'serviceKey': self.api_key,
+            'arsId': ars_id,
+            'resultType': 'json'
+        }
+        response = await self.request(
+            '/api/rest/stationinfo/getStationByUid', params, settings.UPSTREAM_ARRIVAL_DEADLINE
+        )
+
+        # 실패를 빈 목록으로 바꾸면 캐시가 이전 도착 정보 대신 빈 값을 저장하므로 예외로 전달
+        if response.status_code != 200:
+            raise UpstreamError(f"SEL 도착 정보 요청 실패: {response.status_code}")
+        try:
+            return self.parse_arrivals(response.json(), ars_id)
+        except Exception as e:
+            raise UpstreamError(f"SEL 도착 정보 JSON 파싱 오류: {e}")
+
+    async def get_routes_by_station(self, ars_id: str) -> List[dict]:
+        """정류소ID -> 지나는 모든 버스 노선 id,이름,첫차,막차,유형등"""
+        params = {
+            'serviceKey': self.api_key,
+            'arsId': ars_id,
+            'resultType': 'json'
+        }
+        response = await self.request(
+            '/api/rest/stationinfo/getRouteByStation', params, settings.UPSTREAM_ROUTE_DEADLINE
+        )
+
+        if response.status_code == 200:
+            try:
+                return self.parse_routes(response.json())
+            except Exception as e:
+                print(f"⚠️ API 응답 파싱 오류: {e}")
+                return []
+        print(f"❌ API 요청 실패: {response.status_code}")
+        return []
+
+    async def fetch_arrivals(self, ars_id: str) -> List[ArrivalRecord]:
+        """정류소 지나는 모든 버스노선 (노선 목록 + 실시간 도착 정보 병합)"""
+        # 전체 노선 목록(DB 캐시)과 실시간 도착정보를 동시에 요청
+        routes, arrivals = await asyncio.gather(
+            self.call_with_timeout(
+                route_cache.get_routes(ars_id, self.get_routes_by_station, self.route_ttl), "노선 목록"
+            ),
+            self.call_with_timeout(self.get_arrival_info_by_ars_id(ars_id), "도착 정보"),
+            return_exceptions=True
+        )
+
+        # 노선 목록 실패는 도착 정보에 있는 노선만으로 응답
+        if isinstance(routes, Exception):
+            print(f"❌ 노선 목록 요청 중 오류: {routes}")
+            routes = []
+        if isinstance(arrivals, Exception):
+            print(f"❌ 도착 정보 요청 중 오류: {arrivals}")
+            if not isinstance(arrivals, UpstreamError):
+                arrivals = UpstreamError(f"SEL 도착 정보 요청 중 오류: {arrivals}")
+            if not routes:
+                raise arrivals
+            # 도착 정보 없이 노선 목록만 있는 결과는 캐시된 도착 정보가 없을 때만 사용 (ArrivalCache._fetch)
+            raise UpstreamPartialError(str(arrivals), self.merge_routes(ars_id, routes, []))
+        return self.merge_routes(ars_id, routes, arrivals)
+
+    def merge_routes(self, ars_id: str, routes: List[dict], arrivals: List[ArrivalRecord]) -> List[ArrivalRecord]:
+        """노선 목록 + 도착 정보 병합 (도착 정보가 없는 노선도 포함)"""
+        # 노선 목록을 못 받은 경우 도착 정보에 있는 노선만이라도 반환
+        if not routes:
+            return arrivals
+
+        # 도착 정보를 노선 ID로 매핑
+        arrival_map = {a.bus_route_id: a for a in arrivals}
+
+        result = []
+        for r in routes:
+            route_id = r['busRouteId']
+            arrival = arrival_map.get(route_id)
+            result.append(ArrivalRecord(
+                bus_route_id=route_id,
+                route_name=r['busRouteNm'],
+                route_type=r['busRouteType'],
+                direction=arrival.direction if arrival else '',
+                ars_id=ars_id,
+                eta1=arrival.eta1 if arrival else None,
+                stops1=arrival.stops1 if arrival else None,
+                status1=arrival.status1 if arrival else '도착 정보 없음',
+                eta2=arrival.eta2 if arrival else None,
+                stops2=arrival.stops2 if arrival else None,
+                status2=arrival.status2 if arrival else '',
+                note1=arrival.note1 if arrival else None,
+                note2=arrival.note2 if arrival else None
+            ))
+        return result
+
+class GyeonggiBusProvider(BusProvider):
+    """경기도 버스 API (apis.data.go.kr 버스도착정보 v2)"""
+
+    code = "KYG"
+    name = "경기"
+
+    def __init__(self):
+        # 경기도 API는 SSL 문제가 있으므로 HTTP로 호출 (인증서 검증 안 함)
+        super().__init__(
+            base_url=settings.KYG_API_BASE_URL,
+            concurrency=settings.KYG_CONCURRENCY,
+            arrival_ttl=settings.KYG_ARRIVAL_TTL,
+            max_connections=settings.KYG_MAX_CONNECTIONS,
+            headers=KYG_HEADERS,
+            verify=False
+        )
+
+    def parse_arrivals(self, data: dict, station_id: str) -> List[ArrivalRecord]:
+        """getBusArrivalListv2 응답 -> 도착 정보"""
+        # 도착 정보가 없으면 msgBody 없이 msgHeader만 옴
+        msg_body = data.get('response', {}).get('msgBody') or {}
+        items = msg_body.get('busArrivalList') or []
+        if isinstance(items, dict):
+            items = [items]
+
+        result = []
+        for item in items:
+            # 예상 도착 초/남은 정류장 수를 숫자 그대로 보관 (빈 문자열, None, 0은 정보 없음)
+            eta1 = to_int(item.get('predictTimeSec1'))
+            eta2 = to_int(item.get('predictTimeSec2'))
+            result.append(ArrivalRecord(
+                bus_route_id=str(item.get('routeId', '')),
+                route_name=item.get('routeName', ''),
+                route_type=item.get('routeTypeCd', ''),
+                direction=item.get('routeDestName', ''),
+                ars_id=station_id,
+                eta1=eta1,
+                stops1=to_int(item.get('locationNo1')),
+                status1=None if eta1 else '정보 없음',
+                eta2=eta2,
+                stops2=to_int(item.get('locationNo2')),
+                status2=None if eta2 else ''
+            ))
+        return result
+
+    async def fetch_arrivals(self, station_id: str) -> List[ArrivalRecord]:
+        """경기도 버스 정류소 도착 정보 조회"""
+        params = {
+            'serviceKey': self.api_key,
+            'stationId': station_id,
+            'format': 'json'
+        }
+
+        # 공유 클라이언트 사용 (keep-alive 연결 재사용, 재시도/회로 차단기 적용)
+        response = await self.request(
+            '/6410000/busarrivalservice/v2/getBusArrivalListv2', params, settings.UPSTREAM_ARRIVAL_DEADLINE
+        )
+
+        # 실패를 빈 목록으로 바꾸면 캐시가 이전 도착 정보 대신 빈 값을 저장하므로 예외로 전달
+        if response.status_code != 200:
+            raise UpstreamError(f"경기도 API 요청 실패: {response.status_code}")
+        try:
+            return self.parse_arrivals(response.json(), station_id)
+        except Exception as e:
+            raise UpstreamError(f"경기도 API JSON 파싱 오류: {e}")
+
+class ProviderRegistry:
+    """지역 코드 -> 버스 API 제공자 (등록되지 않은 지역은 기본 지역으로 조회)"""
+
+    def __init__(self, cache: ArrivalCache, default_code: str = "SEL"):
+        self.cache = cache
+        self.default_code = default_code
+        self._providers: Dict[str, BusProvider] = {}
+
+    def register(self, provider: BusProvider) -> BusProvider:
+        """제공자 등록 (지역 전용 외부 API 연결 풀도 함께 설정)"""
+        upstream_clients.configure(
+            provider.code,
+            base_url=provider.base_url,
+            headers=provider.headers,
+            verify=provider.verify,
+            max_connections=provider.max_connections
+        )
+        self._providers[provider.code] = provider
+        return provider
+
+    def codes(self) -> List[str]:
+        """등록된 지역 코드 목록"""
+        return list(self._providers)
+
+    def resolve(self, location: Optional[str]) -> str:
+        """정류소 location 값 -> 등록된 지역 코드 (없으면 기본 지역)"""
+        return location if location in self._providers else self.default_code
+
+    def get(self, code: Optional[str]) -> BusProvider:
+        """지역 코드의 제공자"""
+        return self._providers[self.resolve(code)]
+
+    def station_code(self, ars_id: str) -> str:
+        """정류소 ars_id -> 지역 코드 (bus_stations.location 기준, 없으면 기본 지역)"""
+        db = SessionLocal()
+        try:
+            row = db.query(BusStation.location).filter(BusStation.ars_id == ars_id).first()
+        finally:
+            db.close()
+        return self.resolve(row[0] if row else None)
+
+    async def get_routes_by_station(self, ars_id: str) -> List[dict]:
+        """정류소 지역 제공자의 경유 노선 목록 (노선 목록 캐시 백그라운드 갱신용)"""
+        return await self.get(self.station_code(ars_id)).get_routes_by_station(ars_id)
+
+    async def get_bus_list(self, code: str, ars_id: str, max_stale: float = 0.0) -> Tuple[List[ArrivalRecord], float]:
+        """지역 정류소 도착 정보와 경과 시간 (지역별 TTL 캐시 우선)"""
+        provider = self.get(code)
+        return await self.cache.get_or_fetch_with_age(
+            (provider.code, ars_id),
+            lambda: provider.fetch_bus_list(ars_id),
+            max_stale,
+            provider.arrival_ttl
+        )
+
+    async def get_bus_lists(self, locations: Dict[str, Optional[str]]) -> Dict[str, object]:
+        """여러 정류소(ars_id -> 지역 코드)의 도착 정보 동시 조회 (ars_id -> 목록 또는 예외)"""
+        codes = {ars_id: self.resolve(location) for ars_id, location in locations.items()}
+        # 요청 하나가 한 지역 API 동시 호출 한도를 다 쓰지 않도록 지역별로 추가 제한
+        semaphores = {code: asyncio.Semaphore(settings.ARRIVAL_BATCH_CONCURRENCY) for code in set(codes.values())}
+
+        async def fetch(ars_id: str):
+            async with semaphores[codes[ars_id]]:
+                arrivals, _ = await self.get_bus_list(codes[ars_id], ars_id)
+                return arrivals
+
+        ars_ids = list(codes)
+        results = await asyncio.gather(*(fetch(ars_id) for ars_id in ars_ids), return_exceptions=True)
+        return dict(zip(ars_ids, results))
+
+    async def refresh_bus_list(self, code: str, ars_id: str) -> List[ArrivalRecord]:
+        """캐시와 관계없이 다시 조회해서 캐시에 저장 (미리 갱신용)"""
+        provider = self.get(code)
+        return await self.cache.refresh(
+            (provider.code, ars_id),
+            lambda: provider.fetch_bus_list(ars_id),
+            provider.arrival_ttl
+        )
+
+    def stats(self) -> dict:
+        """지역별 호출 통계"""
+        return {code: provider.stats() for code, provider in self._providers.items()}
+
+# 전역 지역 제공자 목록 (새 지역은 BusProvider를 상속해 여기에 등록)
+provider_registry = ProviderRegistry(arrival_cache)
+provider_registry.register(SeoulBusProvider())
+provider_registry.register(GyeonggiBusProvider())
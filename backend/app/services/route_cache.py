@@ -0,0 +1,191 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from ..database.connection import SessionLocal
+from ..models.station_route_cache_model import StationRouteCache
+from .upstream_quota import upstream_priority, PRIORITY_BACKGROUND
+from config import settings
+
+# 정류소 ars_id -> 노선 목록 (getRouteByStation itemList)
+RouteFetcher = Callable[[str], Awaitable[List[dict]]]
+
+class RouteListCache:
+    """정류소 경유 노선 목록 DB 캐시 (만료된 항목은 기존 값을 주고 백그라운드에서 갱신)"""
+
+    def __init__(self, ttl: int = settings.ROUTE_CACHE_TTL):
+        self.ttl = ttl
+        self.fetch: Optional[RouteFetcher] = None
+        # ars_id -> 진행 중인 갱신 작업
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def _load(self, ars_id: str) -> Optional[Tuple[List[dict], datetime]]:
+        """DB에 저장된 노선 목록과 받아온 시각"""
+        db = SessionLocal()
+        try:
+            row = db.query(StationRouteCache).filter(StationRouteCache.ars_id == ars_id).first()
+            if row is None:
+                return None
+            return json.loads(row.routes_json), row.fetched_at
+        finally:
+            db.close()
+
+    def _store(self, ars_id: str, routes: List[dict]):
+        """노선 목록 저장 (있으면 갱신)"""
+        db = SessionLocal()
+        try:
+            row = db.query(StationRouteCache).filter(StationRouteCache.ars_id == ars_id).first()
+            if row is None:
+                row = StationRouteCache(ars_id=ars_id)
+                db.add(row)
+            row.routes_json = json.dumps(routes, ensure_ascii=False)
+            row.fetched_at = datetime.utcnow()
+            db.commit()
+        except IntegrityError:
+            # 다른 프로세스가 먼저 저장한 경우
+            db.rollback()
+        finally:
+            db.close()
+
+    def is_expired(self, fetched_at: datetime, ttl: Optional[int] = None) -> bool:
+        """TTL이 지났는지 여부 (ttl이 없으면 기본 TTL)"""
+        return datetime.utcnow() - fetched_at > timedelta(seconds=self.ttl if ttl is None else ttl)
+
+    async def get_routes(self, ars_id: str, fetch: Optional[RouteFetcher] = None, ttl: Optional[int] = None) -> List[dict]:
+        """정류소 경유 노선 목록 (DB에 없을 때만 외부 API 호출을 기다림)"""
+        fetch = fetch or self.fetch
+        cached = self._load(ars_id)
+        if cached is not None:
+            routes, fetched_at = cached
+            if not self.is_expired(fetched_at, ttl):
+                self.hits += 1
+            else:
+                # 노선 목록은 거의 바뀌지 않으므로 기존 값으로 응답하고 갱신은 백그라운드에서
+                self.stale_hits += 1
+                self.refresh_in_background(ars_id, fetch)
+            return routes
+
+        self.misses += 1
+        return await self.refresh(ars_id, fetch)
+
+    async def refresh(self, ars_id: str, fetch: Optional[RouteFetcher] = None) -> List[dict]:
+        """외부 API에서 노선 목록을 다시 받아 저장 (같은 정류소 갱신은 하나로 합침)"""
+        task = self._refreshing.get(ars_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(ars_id, fetch or self.fetch))
+            self._refreshing[ars_id] = task
+        return await asyncio.shield(task)
+
+    def refresh_in_background(self, ars_id: str, fetch: Optional[RouteFetcher] = None):
+        """응답을 기다리지 않고 노선 목록 갱신 시작"""
+        if ars_id in self._refreshing:
+            return
+
+        async def background_refresh():
+            # 백그라운드 갱신은 사용자 요청보다 낮은 우선순위로 호출 한도 사용
+            upstream_priority.set(PRIORITY_BACKGROUND)
+            return await self.refresh(ars_id, fetch)
+
+        task = asyncio.ensure_future(background_refresh())
+        # 백그라운드 갱신 실패는 _fetch_and_store에서 기록하므로 예외만 회수
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _fetch_and_store(self, ars_id: str, fetch: RouteFetcher) -> List[dict]:
+        """노선 목록 조회 후 DB 저장 (빈 목록은 실패일 수 있으므로 저장하지 않음)"""
+        try:
+            routes = await asyncio.wait_for(fetch(ars_id), settings.UPSTREAM_CALL_TIMEOUT)
+            if routes:
+                self._store(ars_id, routes)
+                self.refreshes += 1
+            return routes
+        except Exception:
+            self.refresh_failures += 1
+            raise
+        finally:
+            self._refreshing.pop(ars_id, None)
+
+    def invalidate(self, ars_id: Optional[str] = None) -> int:
+        """캐시 삭제 (ars_id가 없으면 전체), 삭제한 정류소 수 반환"""
+        db = SessionLocal()
+        try:
+            query = db.query(StationRouteCache)
+            if ars_id is not None:
+                query = query.filter(StationRouteCache.ars_id == ars_id)
+            deleted = query.delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    async def refresh_expired(self, limit: int = settings.ROUTE_CACHE_REFRESH_BATCH) -> int:
+        """만료된 노선 목록을 오래된 순으로 limit개 갱신"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+        db = SessionLocal()
+        try:
+            rows = db.query(StationRouteCache.ars_id) \
+                .filter(StationRouteCache.fetched_at < cutoff) \
+                .order_by(StationRouteCache.fetched_at) \
+                .limit(limit) \
+                .all()
+        finally:
+            db.close()
+
+        refreshed = 0
+        # 외부 API 호출량을 고려해 한 정류소씩 순서대로 갱신
+        for (ars_id,) in rows:
+            try:
+                if await self.refresh(ars_id):
+                    refreshed += 1
+            except Exception as e:
+                print(f"⚠️ 노선 목록 갱신 실패 ({ars_id}): {e}")
+        return refreshed
+
+    async def _run(self, interval: int):
+        """주기적으로 만료된 노선 목록 갱신"""
+        upstream_priority.set(PRIORITY_BACKGROUND)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                refreshed = await self.refresh_expired()
+                if refreshed:
+                    print(f"🔄 정류소 노선 목록 갱신: {refreshed}개")
+            except Exception as e:
+                print(f"⚠️ 노선 목록 백그라운드 갱신 오류: {e}")
+
+    def start(self, fetch: RouteFetcher, interval: int = settings.ROUTE_CACHE_REFRESH_INTERVAL):
+        """백그라운드 갱신 시작 (애플리케이션 시작 시)"""
+        self.fetch = fetch
+        if self._task is None and interval > 0:
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self):
+        """백그라운드 갱신 중지 (애플리케이션 종료 시)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict:
+        """캐시 사용 통계"""
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refreshFailures": self.refresh_failures,
+            "refreshing": len(self._refreshing)
+        }
+
+# 전역 노선 목록 캐시 인스턴스
+route_cache = RouteListCache()
@@ -0,0 +1,115 @@
+from collections import namedtuple
+from typing import Dict, List, Optional
+import numpy as np
+from sqlalchemy.orm import Session
+from .station_index import StationCatalog, StationSpatialIndex, station_index
+from .station_tiles import MIN_TILE_ZOOM
+from ..utils.geo import mercator_xy_np
+
+# 클러스터를 제공하는 줌 범위 (MIN_TILE_ZOOM 부터는 타일로 개별 정류소 제공)
+MIN_CLUSTER_ZOOM = 0
+MAX_CLUSTER_ZOOM = MIN_TILE_ZOOM - 1
+# 클러스터 격자 한 칸의 화면 크기 (단위: px, 256px 타일 기준)
+CLUSTER_CELL_PX = 64
+
+# 줌 레벨 하나의 클러스터 배열 (centroid, bbox, 개수, 단일 정류소일 때의 카탈로그 인덱스)
+ZoomClusters = namedtuple(
+    "ZoomClusters", ["counts", "lats", "lons", "south", "west", "north", "east", "first"]
+)
+
+def build_zoom_clusters(catalog: StationCatalog, mx: np.ndarray, my: np.ndarray, z: int) -> ZoomClusters:
+    """줌 레벨 z의 화면 격자로 정류소를 묶어 클러스터 생성"""
+    scale = (2 ** z) * 256 // CLUSTER_CELL_PX
+    cx = np.minimum(np.floor(mx * scale), scale - 1).astype(np.int64)
+    cy = np.clip(np.floor(my * scale), 0, scale - 1).astype(np.int64)
+    keys = cx * scale + cy
+
+    # 같은 격자 칸끼리 정렬해서 구간별로 집계
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    counts = np.diff(np.r_[starts, len(order)])
+    lats = catalog.latitudes[order]
+    lons = catalog.longitudes[order]
+
+    return ZoomClusters(
+        counts=counts,
+        lats=np.add.reduceat(lats, starts) / counts,
+        lons=np.add.reduceat(lons, starts) / counts,
+        south=np.minimum.reduceat(lats, starts),
+        west=np.minimum.reduceat(lons, starts),
+        north=np.maximum.reduceat(lats, starts),
+        east=np.maximum.reduceat(lons, starts),
+        first=order[starts]
+    )
+
+class StationClusterIndex:
+    """줌 레벨별 정류소 클러스터 (정류소 인덱스 재생성 시 미리 계산)"""
+
+    def __init__(self, index: StationSpatialIndex):
+        self.index = index
+        self.version: Optional[str] = None
+        self._catalog = StationCatalog.from_rows([])
+        self._zooms: Dict[int, ZoomClusters] = {}
+        index.add_listener(self.build)
+
+    def build(self, catalog: StationCatalog, version: Optional[str] = None):
+        """모든 클러스터 줌 레벨 계산"""
+        zooms: Dict[int, ZoomClusters] = {}
+        if len(catalog):
+            mx, my = mercator_xy_np(catalog.latitudes, catalog.longitudes)
+            for z in range(MIN_CLUSTER_ZOOM, MAX_CLUSTER_ZOOM + 1):
+                zooms[z] = build_zoom_clusters(catalog, mx, my, z)
+
+        self._catalog, self._zooms = catalog, zooms
+        self.version = version
+
+    def get_clusters(
+        self,
+        db: Session,
+        z: int,
+        south: Optional[float] = None,
+        west: Optional[float] = None,
+        north: Optional[float] = None,
+        east: Optional[float] = None
+    ) -> List[dict]:
+        """줌 레벨 z에서 화면 범위 안에 중심이 있는 클러스터 목록"""
+        self.index.ensure_fresh(db)
+        catalog, clusters = self._catalog, self._zooms.get(z)
+        if clusters is None:
+            return []
+
+        mask = np.ones(len(clusters.counts), dtype=bool)
+        if south is not None:
+            mask &= clusters.lats >= south
+        if north is not None:
+            mask &= clusters.lats <= north
+        if west is not None:
+            mask &= clusters.lons >= west
+        if east is not None:
+            mask &= clusters.lons <= east
+
+        result = []
+        for i in np.flatnonzero(mask).tolist():
+            count = int(clusters.counts[i])
+            cluster = {
+                "count": count,
+                "x": float(clusters.lons[i]),
+                "y": float(clusters.lats[i]),
+                "bbox": [
+                    float(clusters.south[i]),
+                    float(clusters.west[i]),
+                    float(clusters.north[i]),
+                    float(clusters.east[i])
+                ]
+            }
+            # 정류소가 하나뿐인 클러스터는 정류소 정보도 함께 제공
+            if count == 1:
+                station = catalog.record(int(clusters.first[i]))
+                cluster["arsId"] = station.ars_id
+                cluster["stNm"] = station.station_name
+            result.append(cluster)
+        return result
+
+# 전역 클러스터 인덱스 인스턴스
+station_cluster_index = StationClusterIndex(station_index)
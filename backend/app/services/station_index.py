@@ -0,0 +1,222 @@
+import threading
+import time
+from collections import namedtuple
+from math import cos, radians
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ..models.bus_station_model import BusStation
+from ..utils.geo import (
+    haversine_np, grid_cell_ids_np, grid_cells_in_radius, project_xy,
+    METERS_PER_DEG_LAT
+)
+from config import settings
+
+# 투영 오차 보정용 여유 (KD-tree 후보를 넉넉히 뽑은 뒤 실제 거리로 재정렬)
+KNN_EXTRA_CANDIDATES = 8
+KNN_RADIUS_SLACK = 1.05
+
+# 개별 정류소 정보 (카탈로그 배열에서 꺼낼 때 사용)
+StationRecord = namedtuple(
+    "StationRecord", ["ars_id", "station_name", "longitude", "latitude", "location"]
+)
+
+def get_station_dataset_version(db: Session) -> str:
+    """bus_stations 테이블 버전 (행 수, 최대 ID, 최종 수정 시각)"""
+    count, max_id, last_updated = db.query(
+        func.count(BusStation.id), func.max(BusStation.id), func.max(BusStation.updated_at)
+    ).one()
+    return f"{count}-{max_id or 0}-{last_updated or ''}"
+
+class StationCatalog:
+    """정류소 배열 카탈로그 (컬럼별 연속 NumPy 배열)"""
+
+    def __init__(self, ars_ids, station_names, longitudes, latitudes, locations):
+        self.ars_ids = np.asarray(ars_ids, dtype=object)
+        self.station_names = np.asarray(station_names, dtype=object)
+        self.longitudes = np.ascontiguousarray(longitudes, dtype=np.float64)
+        self.latitudes = np.ascontiguousarray(latitudes, dtype=np.float64)
+        self.locations = np.asarray(locations, dtype=object)
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_rows(cls, rows) -> "StationCatalog":
+        """(ars_id, station_name, longitude, latitude, location) 행 목록으로 생성"""
+        rows = list(rows)
+        if not rows:
+            return cls([], [], [], [], [])
+        return cls(*zip(*rows))
+
+    def __len__(self) -> int:
+        return len(self.ars_ids)
+
+    def position(self, ars_id: str) -> Optional[int]:
+        """ars_id의 카탈로그 인덱스 (없으면 None)"""
+        if self._positions is None:
+            self._positions = {ars_id: i for i, ars_id in enumerate(self.ars_ids.tolist())}
+        return self._positions.get(ars_id)
+
+    def record(self, i: int) -> StationRecord:
+        """i번째 정류소"""
+        return StationRecord(
+            self.ars_ids[i],
+            self.station_names[i],
+            float(self.longitudes[i]),
+            float(self.latitudes[i]),
+            self.locations[i]
+        )
+
+    def distances(self, lat: float, lon: float, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """한 점에서 카탈로그 정류소(또는 후보 indices)까지의 거리 일괄 계산"""
+        if indices is None:
+            return haversine_np(lat, lon, self.latitudes, self.longitudes)
+        return haversine_np(lat, lon, self.latitudes[indices], self.longitudes[indices])
+
+class StationSpatialIndex:
+    """정류소 공간 인덱스 (메모리, 위경도 격자 + KD-tree)"""
+
+    def __init__(self, refresh_seconds: int = settings.STATION_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.version: Optional[str] = None
+        self.catalog = StationCatalog.from_rows([])
+        self._cells: Dict[int, np.ndarray] = {}
+        self._tree: Optional[cKDTree] = None
+        self._ref_lat = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        # 인덱스 재생성 시 함께 갱신할 파생 데이터 (클러스터 등)
+        self._listeners: List[Callable[[StationCatalog, Optional[str]], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def build(self, catalog: StationCatalog, version: Optional[str] = None):
+        """카탈로그로 격자 인덱스(셀 ID -> 카탈로그 인덱스 배열)와 KD-tree 생성"""
+        cells: Dict[int, np.ndarray] = {}
+        tree, ref_lat = None, 0.0
+        if len(catalog):
+            cell_ids = grid_cell_ids_np(catalog.latitudes, catalog.longitudes)
+            order = np.argsort(cell_ids, kind="stable")
+            sorted_ids = cell_ids[order]
+            # 같은 셀끼리 묶어서 분할
+            starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+            for cell, members in zip(sorted_ids[starts], np.split(order, starts[1:])):
+                cells[int(cell)] = members
+
+            # 평균 위도 기준 평면 좌표로 KD-tree 생성
+            ref_lat = float(catalog.latitudes.mean())
+            tree = cKDTree(project_xy(catalog.latitudes, catalog.longitudes, ref_lat))
+
+        # 완성된 인덱스로 한 번에 교체 (조회 중인 요청은 이전 인덱스를 계속 사용)
+        self.catalog, self._cells = catalog, cells
+        self._tree, self._ref_lat = tree, ref_lat
+        self.version = version
+        self._checked_at = time.monotonic()
+
+        for listener in self._listeners:
+            try:
+                listener(catalog, version)
+            except Exception as e:
+                print(f"⚠️ 정류소 인덱스 후처리 오류: {e}")
+
+    def add_listener(self, listener: Callable[[StationCatalog, Optional[str]], None]):
+        """인덱스가 다시 만들어질 때마다 호출할 함수 등록 (이미 만들어졌으면 즉시 호출)"""
+        self._listeners.append(listener)
+        if self.version is not None:
+            listener(self.catalog, self.version)
+
+    def rebuild(self, db: Session):
+        """DB에서 정류소를 읽어 인덱스 재생성"""
+        with self._lock:
+            version = get_station_dataset_version(db)
+            rows = db.query(
+                BusStation.ars_id,
+                BusStation.station_name,
+                BusStation.longitude,
+                BusStation.latitude,
+                BusStation.location
+            ).order_by(BusStation.id).yield_per(5000)
+            self.build(StationCatalog.from_rows(rows), version)
+            print(f"정류소 공간 인덱스 생성 완료: {len(self.catalog)}개 ({len(self._cells)}개 셀)")
+
+    def invalidate(self):
+        """다음 조회 시 DB 버전을 다시 확인하도록 표시"""
+        self._checked_at = 0.0
+
+    def ensure_fresh(self, db: Session):
+        """DB 데이터가 바뀌었으면 인덱스 재생성 (refresh_seconds 주기로 확인)"""
+        now = time.monotonic()
+        if self.version is not None and now - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = now
+        if get_station_dataset_version(db) != self.version:
+            self.rebuild(db)
+
+    def query_radius(self, lat: float, lon: float, radius_m: float) -> Tuple[np.ndarray, np.ndarray]:
+        """반경 radius_m 안의 정류소 (카탈로그 인덱스 배열, 거리 배열)"""
+        catalog, cells = self.catalog, self._cells
+        candidates = [cells[cell] for cell in grid_cells_in_radius(lat, lon, radius_m) if cell in cells]
+        if not candidates:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        indices = np.concatenate(candidates)
+        dists = catalog.distances(lat, lon, indices)
+        mask = dists <= radius_m
+        indices, dists = indices[mask], dists[mask]
+        return indices, dists
+
+    def query_bbox(self, south: float, west: float, north: float, east: float) -> np.ndarray:
+        """위경도 범위 안의 정류소 카탈로그 인덱스 배열 (남/서 경계 포함, 북/동 경계 제외)"""
+        catalog = self.catalog
+        lats, lons = catalog.latitudes, catalog.longitudes
+        mask = (lats >= south) & (lats < north) & (lons >= west) & (lons < east)
+        return np.flatnonzero(mask)
+
+    def query_knn(self, lat: float, lon: float, k: int, max_radius_m: float) -> Tuple[np.ndarray, np.ndarray]:
+        """가장 가까운 정류소 k개 (카탈로그 인덱스 배열, 거리 배열, 거리순 정렬)"""
+        catalog, tree, ref_lat = self.catalog, self._tree, self._ref_lat
+        if tree is None or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        point = project_xy(np.array([lat]), np.array([lon]), ref_lat)[0]
+        candidates = min(k + KNN_EXTRA_CANDIDATES, len(catalog))
+        _, indices = tree.query(point, k=candidates, distance_upper_bound=max_radius_m * KNN_RADIUS_SLACK)
+        indices = np.atleast_1d(indices)
+        # 반경 밖 후보는 len(catalog)로 채워져 반환됨
+        indices = indices[indices < len(catalog)]
+
+        # 실제 거리(Haversine)로 다시 걸러서 정렬
+        dists = catalog.distances(lat, lon, indices)
+        mask = dists <= max_radius_m
+        indices, dists = indices[mask], dists[mask]
+        order = np.argsort(dists, kind="stable")[:k]
+        return indices[order], dists[order]
+
+def query_radius_db(db: Session, lat: float, lon: float, radius_m: float) -> Tuple[StationCatalog, np.ndarray, np.ndarray]:
+    """DB 격자 셀 인덱스로 반경 radius_m 안의 정류소 조회 (카탈로그, 인덱스 배열, 거리 배열)"""
+    dlat = radius_m / METERS_PER_DEG_LAT
+    dlon = radius_m / (METERS_PER_DEG_LAT * max(cos(radians(lat)), 0.01))
+
+    # 격자 셀 + 위경도 범위로 후보만 가져온 뒤 정확한 거리 계산
+    rows = db.query(
+        BusStation.ars_id,
+        BusStation.station_name,
+        BusStation.longitude,
+        BusStation.latitude,
+        BusStation.location
+    ).filter(
+        BusStation.grid_cell.in_(grid_cells_in_radius(lat, lon, radius_m)),
+        BusStation.latitude.between(lat - dlat, lat + dlat),
+        BusStation.longitude.between(lon - dlon, lon + dlon)
+    ).all()
+
+    catalog = StationCatalog.from_rows(rows)
+    dists = catalog.distances(lat, lon)
+    indices = np.flatnonzero(dists <= radius_m)
+    dists = dists[indices]
+    return catalog, indices, dists
+
+# 전역 정류소 인덱스 인스턴스
+station_index = StationSpatialIndex()
@@ -0,0 +1,153 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from sqlalchemy.orm import Session
+from .station_index import StationCatalog, StationSpatialIndex, station_index
+from ..utils.hangul import to_choseong
+
+def normalize_name(name: str) -> str:
+    """검색용 정류소 이름 정규화 (소문자)"""
+    return name.strip().lower()
+
+def choseong_name(name: str) -> str:
+    """초성 검색용 정류소 이름 정규화 (예: "강남역" -> "ㄱㄴㅇ", 공백 제거)"""
+    return to_choseong("".join(name.lower().split()))
+
+def prefix_key(name: str) -> str:
+    """자동완성용 이름 키 (소문자, 공백 제거)"""
+    return "".join(name.lower().split())
+
+def name_grams(name: str) -> set:
+    """이름의 1-gram + 2-gram 집합"""
+    grams = set(name)
+    grams.update(name[i:i + 2] for i in range(len(name) - 1))
+    return grams
+
+class StationNameIndex:
+    """정류소 이름 n-gram 역색인 (부분 문자열 검색용)"""
+
+    def __init__(self, index: StationSpatialIndex, normalize: Callable[[str], str] = normalize_name):
+        self.index = index
+        self.normalize = normalize
+        self.version: Optional[str] = None
+        self.catalog = StationCatalog.from_rows([])
+        self._names: List[str] = []
+        self._postings: Dict[str, np.ndarray] = {}
+        index.add_listener(self.build)
+
+    def build(self, catalog: StationCatalog, version: Optional[str] = None):
+        """카탈로그로 역색인 생성 (기존 카탈로그 뒤에 추가만 된 경우 새 정류소만 색인)"""
+        old_catalog, old_size = self.catalog, len(self.catalog)
+        if 0 < old_size <= len(catalog) and \
+                np.array_equal(catalog.ars_ids[:old_size], old_catalog.ars_ids) and \
+                np.array_equal(catalog.station_names[:old_size], old_catalog.station_names):
+            start, names, postings = old_size, list(self._names), dict(self._postings)
+        else:
+            start, names, postings = 0, [], {}
+
+        added: Dict[str, List[int]] = {}
+        for i in range(start, len(catalog)):
+            name = self.normalize(catalog.station_names[i])
+            names.append(name)
+            for gram in name_grams(name):
+                added.setdefault(gram, []).append(i)
+
+        # 카탈로그 순서대로 추가되므로 포스팅 목록은 항상 정렬 상태 유지
+        for gram, indices in added.items():
+            new = np.asarray(indices, dtype=np.int32)
+            postings[gram] = np.concatenate((postings[gram], new)) if gram in postings else new
+
+        self.catalog, self._names, self._postings = catalog, names, postings
+        self.version = version
+        if start:
+            print(f"정류소 이름 색인 추가 ({self.normalize.__name__}): {len(catalog) - start}개")
+
+    def search(self, db: Session, query: str) -> List[int]:
+        """이름에 query가 포함된 정류소의 카탈로그 인덱스 목록 (카탈로그 순)"""
+        self.index.ensure_fresh(db)
+        names, postings = self._names, self._postings
+        query = self.normalize(query)
+        if not query:
+            return list(range(len(names)))
+
+        grams = [query] if len(query) == 1 else [query[i:i + 2] for i in range(len(query) - 1)]
+        lists = []
+        for gram in set(grams):
+            posting = postings.get(gram)
+            if posting is None:
+                return []
+            lists.append(posting)
+
+        # 짧은 포스팅부터 교집합
+        lists.sort(key=len)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                return []
+
+        # 2-gram이 모두 있어도 연속 부분 문자열이 아닐 수 있으므로 최종 확인
+        if len(query) <= 2:
+            return candidates.tolist()
+        return [i for i in candidates.tolist() if query in names[i]]
+
+class StationAutocomplete:
+    """정류소 이름 자동완성 (정렬된 이름 배열 + 이진 탐색)"""
+
+    def __init__(self, index: StationSpatialIndex):
+        self.index = index
+        self.version: Optional[str] = None
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._lengths = np.empty(0, dtype=np.int64)
+        self._counts = np.empty(0, dtype=np.int64)
+        index.add_listener(self.build)
+
+    def build(self, catalog: StationCatalog, version: Optional[str] = None):
+        """고유 정류소 이름을 키 순서로 정렬해 보관 (같은 이름의 정류소 수를 인기도로 사용)"""
+        counts: Dict[str, int] = {}
+        display: Dict[str, str] = {}
+        for name in catalog.station_names.tolist():
+            key = prefix_key(name)
+            if not key:
+                continue
+            counts[key] = counts.get(key, 0) + 1
+            display.setdefault(key, name)
+
+        keys = sorted(counts)
+        self._keys, self._names = keys, [display[key] for key in keys]
+        self._lengths = np.array([len(key) for key in keys], dtype=np.int64)
+        self._counts = np.array([counts[key] for key in keys], dtype=np.int64)
+        self.version = version
+
+    def suggest(self, db: Session, query: str, limit: int = 10) -> List[dict]:
+        """query로 시작하는 정류소 이름 상위 limit개 (짧은 이름, 정류소 많은 이름 순)"""
+        self.index.ensure_fresh(db)
+        keys, names, lengths, counts = self._keys, self._names, self._lengths, self._counts
+        prefix = prefix_key(query)
+        if not prefix or limit <= 0:
+            return []
+
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + "\U0010ffff", lo)
+        if lo == hi:
+            return []
+
+        # 이름 길이 오름차순, 같은 길이면 정류소 수 내림차순
+        scores = lengths[lo:hi] * (int(counts.max()) + 1) - counts[lo:hi]
+        if hi - lo > limit:
+            top = np.argpartition(scores, limit - 1)[:limit]
+        else:
+            top = np.arange(hi - lo)
+        top = top[np.lexsort((top, scores[top]))]
+
+        return [
+            {"stNm": names[lo + i], "count": int(counts[lo + i])}
+            for i in top.tolist()
+        ]
+
+# 전역 정류소 이름 색인 인스턴스
+station_name_index = StationNameIndex(station_index)
+# 초성 검색 색인 (같은 n-gram 역색인을 초성 문자열에 적용)
+station_choseong_index = StationNameIndex(station_index, normalize=choseong_name)
+station_autocomplete = StationAutocomplete(station_index)
@@ -0,0 +1,69 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+import orjson
+from sqlalchemy.orm import Session
+from .station_index import StationSpatialIndex, station_index
+from ..utils.geo import tile_bounds
+
+# 정류소 마커를 타일로 내려주는 줌 범위 (더 낮은 줌은 클러스터 사용)
+MIN_TILE_ZOOM = 12
+MAX_TILE_ZOOM = 21
+# 메모리에 보관할 타일 수
+TILE_CACHE_SIZE = 4096
+# 브라우저/프록시 캐시 시간 (단위: 초, 이후에는 ETag로 재검증)
+TILE_MAX_AGE = 300
+
+class StationTileCache:
+    """정류소 타일 캐시 (데이터셋 버전별 메모이제이션)"""
+
+    def __init__(self, index: StationSpatialIndex, max_size: int = TILE_CACHE_SIZE):
+        self.index = index
+        self.max_size = max_size
+        self._version: Optional[str] = None
+        self._tiles: "OrderedDict[Tuple[int, int, int], Tuple[bytes, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _render(self, z: int, x: int, y: int) -> bytes:
+        """타일 안의 정류소 목록을 JSON으로 직렬화"""
+        catalog = self.index.catalog
+        indices = self.index.query_bbox(*tile_bounds(z, x, y))
+        stations = []
+        for i in indices.tolist():
+            station = catalog.record(i)
+            stations.append({
+                "stNm": station.station_name,
+                "arsId": station.ars_id,
+                "x": station.longitude,
+                "y": station.latitude
+            })
+        body = {"success": True, "z": z, "x": x, "y": y, "stations": stations}
+        return orjson.dumps(body)
+
+    def get_tile(self, db: Session, z: int, x: int, y: int) -> Tuple[bytes, str]:
+        """타일 (JSON 본문, 강한 ETag)"""
+        self.index.ensure_fresh(db)
+        version = self.index.version
+        key = (z, x, y)
+
+        with self._lock:
+            # 정류소 데이터가 다시 입력되면 이전 타일은 모두 폐기
+            if version != self._version:
+                self._tiles.clear()
+                self._version = version
+
+            cached = self._tiles.get(key)
+            if cached is not None:
+                self._tiles.move_to_end(key)
+                return cached
+
+            version_hash = hashlib.sha1(str(version).encode("utf-8")).hexdigest()[:16]
+            cached = (self._render(z, x, y), f'"{version_hash}-{z}-{x}-{y}"')
+            self._tiles[key] = cached
+            if len(self._tiles) > self.max_size:
+                self._tiles.popitem(last=False)
+            return cached
+
+# 전역 타일 캐시 인스턴스
+station_tile_cache = StationTileCache(station_index)
@@ -0,0 +1,251 @@
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+import httpx
+from config import settings
+from .upstream_quota import upstream_quota, QuotaExceeded
+
+class UpstreamError(Exception):
+    """외부 API 호출 실패 (재시도 후에도 실패)"""
+
+class UpstreamUnavailable(UpstreamError):
+    """회로 차단기가 열려 호출하지 않고 바로 실패"""
+
+class UpstreamQuotaExceeded(UpstreamUnavailable):
+    """호출 한도가 부족해 호출하지 않고 바로 실패"""
+
+class UpstreamPartialError(UpstreamError):
+    """여러 호출 중 일부만 실패 (partial: 성공한 호출만으로 만든 결과, 캐시된 값이 없을 때만 사용)"""
+
+    def __init__(self, message: str, partial):
+        super().__init__(message)
+        self.partial = partial
+
+def is_retryable_status(status_code: int) -> bool:
+    """재시도할 응답 코드 (서버 오류, 요청 제한)"""
+    return status_code >= 500 or status_code == 429
+
+class CircuitBreaker:
+    """호스트별 회로 차단기 (연속 실패 시 일정 시간 호출 차단, 이후 한 번 시험 호출)"""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """호출 가능 여부"""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = "half_open"
+        if self.state == "half_open":
+            # 시험 호출은 한 번에 하나만
+            if self._probing:
+                self.rejected += 1
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self):
+        """호출 성공 (차단 해제)"""
+        if self.state != "closed":
+            print(f"✅ {self.name} API 회로 차단 해제")
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        """호출 실패 (연속 실패가 기준을 넘거나 시험 호출이 실패하면 차단)"""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                print(f"🚫 {self.name} API 회로 차단 ({self.failures}회 연속 실패)")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self):
+        """결과 없이 끝난 시험 호출 취소 (다음 호출이 다시 시험)"""
+        self._probing = False
+
+    def stats(self) -> dict:
+        """차단기 상태"""
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+class UpstreamClients:
+    """외부 버스 API용 비동기 HTTP 클라이언트 (호스트별 keep-alive 연결 풀)"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # 이름 -> 클라이언트 설정 (지역 제공자가 등록, app.services.bus_providers 참고)
+        self._configs: Dict[str, dict] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+        self.hedges = 0
+
+    def configure(
+        self,
+        name: str,
+        base_url: str,
+        headers: Optional[dict] = None,
+        verify: bool = True,
+        max_connections: Optional[int] = None
+    ):
+        """호스트별 클라이언트 설정 등록 (연결 풀은 이름마다 따로 사용)"""
+        self._configs[name] = {
+            "base_url": base_url,
+            "headers": headers,
+            "verify": verify,
+            "max_connections": max_connections or settings.UPSTREAM_MAX_CONNECTIONS
+        }
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        """호스트별 클라이언트 생성 (설정의 연결 수/타임아웃 사용)"""
+        config = self._configs.get(name)
+        if config is None:
+            raise KeyError(f"등록되지 않은 외부 API: {name}")
+        limits = httpx.Limits(
+            max_connections=config["max_connections"],
+            max_keepalive_connections=min(settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS, config["max_connections"]),
+            keepalive_expiry=settings.UPSTREAM_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            settings.UPSTREAM_READ_TIMEOUT,
+            connect=settings.UPSTREAM_CONNECT_TIMEOUT,
+            pool=settings.UPSTREAM_POOL_TIMEOUT
+        )
+        return httpx.AsyncClient(
+            base_url=config["base_url"], limits=limits, timeout=timeout,
+            headers=config["headers"], verify=config["verify"]
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """지역별 클라이언트 (없으면 생성)"""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._create_client(name)
+        return client
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        """지역별 회로 차단기"""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(
+                name, settings.UPSTREAM_BREAKER_FAILURES, settings.UPSTREAM_BREAKER_RESET
+            )
+        return breaker
+
+    async def _send(self, name: str, path: str, params: dict, timeout: float, api: str) -> httpx.Response:
+        """요청 1회 (UPSTREAM_HEDGE_DELAY 안에 응답이 없으면 같은 요청을 하나 더 보내 먼저 온 응답 사용)"""
+        client = self.get(name)
+        deadline = time.monotonic() + timeout
+        hedge_delay = settings.UPSTREAM_HEDGE_DELAY
+        tasks = {asyncio.ensure_future(client.get(path, params=params))}
+        # 헤징을 쓰지 않거나 이미 두 번째 요청을 보낸 상태
+        hedge_sent = not (0 < hedge_delay < timeout)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                wait = remaining if hedge_sent else min(hedge_delay, remaining)
+                done, _ = await asyncio.wait(tasks, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if hedge_sent:
+                        raise asyncio.TimeoutError()
+                    hedge_sent = True
+                    # 첫 요청이 늦으면 한 번 더 보냄 (조회 API는 같은 요청을 반복해도 안전, 남는 호출 한도가 있을 때만)
+                    if not upstream_quota.try_acquire(api, params.get('serviceKey')):
+                        continue
+                    self.hedges += 1
+                    tasks.add(asyncio.ensure_future(client.get(path, params=params)))
+                    continue
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        response = task.result()
+                        # 다른 요청이 아직 진행 중이면 서버 오류 응답은 건너뜀
+                        if not tasks or not is_retryable_status(response.status_code):
+                            return response
+                    elif not tasks:
+                        raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def request(self, name: str, path: str, params: dict, deadline: Optional[float] = None) -> httpx.Response:
+        """외부 API GET 호출 (전체 제한 시간 안에서 지터 백오프 재시도, 회로 차단기 적용)
+
+        응답을 받으면 상태 코드와 관계없이 반환하고, 연결 오류/시간 초과로 끝나면 UpstreamError 발생.
+        """
+        breaker = self.breaker(name)
+        if not breaker.allow():
+            raise UpstreamUnavailable(f"{name} API 일시 차단 중")
+
+        end = time.monotonic() + (deadline or settings.UPSTREAM_CALL_TIMEOUT)
+        # 호출 한도는 API(엔드포인트) + 서비스 키별로 계산
+        api = path.rsplit('/', 1)[-1]
+        attempt = 0
+        while True:
+            error: Optional[BaseException] = None
+            response: Optional[httpx.Response] = None
+            try:
+                # 재시도도 호출 한도를 쓰므로 시도마다 허가를 받음
+                await upstream_quota.acquire(api, params.get('serviceKey'), end - time.monotonic())
+                response = await self._send(name, path, params, end - time.monotonic(), api)
+            except (httpx.TransportError, asyncio.TimeoutError) as e:
+                error = e
+            except QuotaExceeded as e:
+                breaker.release()
+                raise UpstreamQuotaExceeded(f"{name} {api} {e}")
+            except BaseException:
+                # 취소 등 호출자 쪽 사유는 실패로 세지 않음 (시험 호출 상태만 되돌림)
+                breaker.release()
+                raise
+
+            if response is not None and not is_retryable_status(response.status_code):
+                breaker.record_success()
+                return response
+
+            # 지수 백오프 + 무작위 지터 (남은 시간 안에서만 재시도)
+            backoff = settings.UPSTREAM_BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5)
+            if attempt >= settings.UPSTREAM_RETRIES or time.monotonic() + backoff >= end:
+                breaker.record_failure()
+                if response is not None:
+                    return response
+                raise UpstreamError(f"{name} API 호출 실패: {type(error).__name__} {error}")
+
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(backoff)
+
+    async def start(self):
+        """애플리케이션 시작 시 클라이언트 준비"""
+        for name in self._configs:
+            self.get(name)
+
+    async def close(self):
+        """애플리케이션 종료 시 연결 풀 정리"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def stats(self) -> dict:
+        """재시도/헤징 횟수, 호스트별 회로 차단기 상태, API별 남은 호출 한도"""
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "breakers": {name: breaker.stats() for name, breaker in self._breakers.items()},
+            "quota": upstream_quota.stats()
+        }
+
+# 전역 외부 API 클라이언트 인스턴스
+upstream_clients = UpstreamClients()
@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config import settings
+
+# 호출 우선순위 (숫자가 작을수록 먼저)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+# 현재 작업의 외부 API 호출 우선순위 (백그라운드 작업은 시작할 때 PRIORITY_BACKGROUND로 설정)
+upstream_priority: ContextVar[int] = ContextVar("upstream_priority", default=PRIORITY_INTERACTIVE)
+
+class QuotaExceeded(Exception):
+    """호출 한도 부족으로 요청을 보내지 않음"""
+
+def quota_day() -> str:
+    """일일 호출 한도 기준 날짜 (공공데이터포털은 한국 시간 자정에 초기화)"""
+    return (datetime.utcnow() + timedelta(hours=9)).strftime("%Y-%m-%d")
+
+class TokenBucket:
+    """초당 호출 수 제한용 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self) -> bool:
+        """토큰이 있으면 하나 사용"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def available(self) -> float:
+        """현재 남은 토큰 수"""
+        self._refill()
+        return self.tokens
+
+    def wait_time(self) -> float:
+        """다음 토큰까지 남은 시간 (단위: 초)"""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate) if self.rate > 0 else 1.0
+
+class QuotaBucket:
+    """API + 서비스 키 하나의 호출 한도 (초당 토큰 버킷, 일일 호출 수, 우선순위 대기열)"""
+
+    def __init__(self):
+        self.rate = TokenBucket(settings.UPSTREAM_RATE_PER_SECOND, settings.UPSTREAM_BURST)
+        self.daily_quota = settings.UPSTREAM_DAILY_QUOTA
+        self.day = quota_day()
+        self.used_today = 0
+        # (우선순위, 순번) 대기열 (맨 앞 요청만 토큰을 가져갈 수 있음)
+        self._waiters: List[Tuple[int, int]] = []
+        self.shed = 0
+
+    def daily_remaining(self) -> Optional[int]:
+        """오늘 남은 호출 수 (한도 미설정 시 None)"""
+        if self.day != quota_day():
+            self.day, self.used_today = quota_day(), 0
+        if self.daily_quota <= 0:
+            return None
+        return max(0, self.daily_quota - self.used_today)
+
+    def queued(self, priority: int) -> int:
+        """우선순위별 대기 중인 요청 수"""
+        return sum(1 for waiter in self._waiters if waiter[0] == priority)
+
+    def check_daily(self, priority: int):
+        """일일 한도 확인 (남은 양이 예비분 이하이면 백그라운드 호출은 보내지 않음)"""
+        remaining = self.daily_remaining()
+        if remaining is None:
+            return
+        reserve = int(self.daily_quota * settings.UPSTREAM_DAILY_RESERVE)
+        if remaining <= 0 or (priority != PRIORITY_INTERACTIVE and remaining <= reserve):
+            self.shed += 1
+            raise QuotaExceeded(f"일일 호출 한도 부족 (남은 호출 {remaining}회)")
+
+class UpstreamQuota:
+    """외부 API 호출 한도 스케줄러 (API/서비스 키별 토큰 버킷, 대화형 요청 우선)"""
+
+    def __init__(self):
+        self._buckets: Dict[str, QuotaBucket] = {}
+        self._sequence = itertools.count()
+
+    def bucket_name(self, api: str, key: Optional[str]) -> str:
+        """버킷 이름 (통계에 공개되므로 서비스 키 대신 키의 짧은 해시 사용)"""
+        if not key:
+            return f"{api}:-"
+        return f"{api}:{hashlib.sha256(key.encode()).hexdigest()[:8]}"
+
+    def bucket(self, api: str, key: Optional[str]) -> QuotaBucket:
+        """API + 서비스 키별 버킷 (없으면 생성)"""
+        name = self.bucket_name(api, key)
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = QuotaBucket()
+        return bucket
+
+    async def acquire(self, api: str, key: Optional[str], timeout: float, priority: Optional[int] = None):
+        """호출 1회 허가 (토큰이 없으면 우선순위 순서로 대기, 한도 부족/대기 초과 시 QuotaExceeded)"""
+        priority = upstream_priority.get() if priority is None else priority
+        bucket = self.bucket(api, key)
+        bucket.check_daily(priority)
+
+        if priority != PRIORITY_INTERACTIVE and bucket.queued(priority) >= settings.UPSTREAM_MAX_BACKGROUND_QUEUE:
+            bucket.shed += 1
+            raise QuotaExceeded("백그라운드 호출 대기열이 가득 참")
+
+        waiter = (priority, next(self._sequence))
+        heapq.heappush(bucket._waiters, waiter)
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                if bucket._waiters[0] == waiter and bucket.rate.try_acquire():
+                    break
+                wait = bucket.rate.wait_time() if bucket._waiters[0] == waiter else 0.01
+                if time.monotonic() + wait > deadline:
+                    bucket.shed += 1
+                    raise QuotaExceeded("호출 한도 대기 시간 초과")
+                await asyncio.sleep(max(wait, 0.001))
+        finally:
+            bucket._waiters.remove(waiter)
+            heapq.heapify(bucket._waiters)
+
+        # 대기하는 동안 한도가 줄었을 수 있으므로 다시 확인
+        bucket.check_daily(priority)
+        bucket.used_today += 1
+
+    def try_acquire(self, api: str, key: Optional[str]) -> bool:
+        """기다리지 않고 바로 쓸 수 있는 토큰이 있을 때만 호출 1회 허가 (헤징용)"""
+        bucket = self.bucket(api, key)
+        remaining = bucket.daily_remaining()
+        if bucket._waiters or (remaining is not None and remaining <= 0) or not bucket.rate.try_acquire():
+            return False
+        bucket.used_today += 1
+        return True
+
+    def stats(self) -> dict:
+        """버킷별 남은 한도와 대기열 길이"""
+        result = {}
+        for name, bucket in self._buckets.items():
+            result[name] = {
+                "tokens": round(bucket.rate.available(), 2),
+                "usedToday": bucket.used_today,
+                "dailyRemaining": bucket.daily_remaining(),
+                "queued": {label: bucket.queued(priority) for priority, label in PRIORITY_NAMES.items()},
+                "shed": bucket.shed
+            }
+        return result
+
+# 전역 외부 API 호출 한도 스케줄러 인스턴스
+upstream_quota = UpstreamQuota()
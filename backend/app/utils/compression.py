@@ -0,0 +1,152 @@
+import zlib
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+def accepted_encodings(accept_encoding: str) -> set:
+    """Accept-Encoding 헤더 -> 허용된 인코딩 목록 (q=0은 제외)"""
+    encodings = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            encodings.add(name.strip())
+    return encodings
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """압축한 응답의 ETag (본문이 달라지므로 인코딩 이름을 붙여 원본과 구분, 예: "abc" -> "abc-br")"""
+    if etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+def etag_base(tag: str) -> str:
+    """If-None-Match의 태그 -> 압축 전 ETag (W/ 접두어와 압축 인코딩 접미어 제거)"""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for encoding in (GzipCompressor.encoding, BrotliCompressor.encoding):
+        suffix = f'-{encoding}"'
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+class GzipCompressor:
+    """gzip 압축 (스트리밍 응답은 조각마다 flush)"""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        # wbits=31: gzip 헤더 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+class BrotliCompressor:
+    """brotli 압축 (같은 크기에서 gzip보다 작음, 대부분의 브라우저가 HTTPS에서 지원)"""
+
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어 (클라이언트가 지원하면 brotli, 아니면 gzip, minimum_size 미만은 그대로)"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compressor_for(self, scope: Scope):
+        """요청의 Accept-Encoding에 맞는 압축기 (지원하지 않으면 None)"""
+        encodings = accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+        if "br" in encodings:
+            return BrotliCompressor(self.brotli_quality)
+        if "gzip" in encodings:
+            return GzipCompressor(self.gzip_level)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # WebSocket 등 HTTP가 아닌 연결은 그대로 전달
+        compressor = self.compressor_for(scope) if scope["type"] == "http" else None
+        if compressor is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressionResponder(self.app, compressor, self.minimum_size)(scope, receive, send)
+
+class CompressionResponder:
+    """응답 하나의 본문 압축 (첫 본문 조각을 보고 압축 여부 결정)"""
+
+    def __init__(self, app: ASGIApp, compressor, minimum_size: int):
+        self.app = app
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 헤더는 첫 본문 조각을 보고 압축 여부를 정한 뒤에 보냄
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            # 이미 인코딩된 응답은 다시 압축하지 않음
+            self.passthrough = "content-encoding" in headers
+            return
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                # 작은 응답은 압축 비용이 이득보다 큼
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.compressor.encoding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self.compressor.encoding)
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                # 스트리밍 응답 (ndjson 등): 길이를 미리 알 수 없음
+                del headers["Content-Length"]
+                message["body"] = self.compressor.compress(body)
+            else:
+                message["body"] = self.compressor.finish(body)
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if not self.passthrough:
+            message["body"] = self.compressor.compress(body) if more_body else self.compressor.finish(body)
+        await self.send(message)
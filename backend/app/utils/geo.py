@@ -0,0 +1,77 @@
+from math import radians, degrees, cos, sin, asin, sqrt, floor, atan, sinh, pi
+from typing import List
+import numpy as np
+
+EARTH_RADIUS_M = 6371000  # 지구 반지름 (단위: m)
+METERS_PER_DEG_LAT = 111320  # 위도 1도당 거리 (단위: m)
+
+# 격자 셀 크기 (도 단위, 약 330m x 265m @ 서울)
+GRID_CELL_DEG = 0.003
+# 셀 ID 인코딩용 열 개수 (360 / GRID_CELL_DEG 보다 커야 함)
+GRID_COLS = 1000000
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """거리 계산 (Haversine 공식)"""
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
+    c = 2 * asin(sqrt(a))
+    return EARTH_RADIUS_M * c
+
+def haversine_np(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """한 점에서 여러 점까지의 거리 일괄 계산 (Haversine 공식, 벡터화)"""
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons - lon)
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    return EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(a))
+
+def project_xy(lats: np.ndarray, lons: np.ndarray, ref_lat: float) -> np.ndarray:
+    """위경도 배열 -> 평면 좌표 (단위: m, ref_lat 기준 등장방형 투영)"""
+    x = np.radians(lons) * EARTH_RADIUS_M * cos(radians(ref_lat))
+    y = np.radians(lats) * EARTH_RADIUS_M
+    return np.column_stack((x, y))
+
+def mercator_xy_np(lats: np.ndarray, lons: np.ndarray) -> tuple:
+    """위경도 배열 -> 웹 메르카토르 정규화 좌표 (0~1, 타일 좌표계와 같은 방향)"""
+    mx = (lons + 180) / 360
+    my = (1 - np.arcsinh(np.tan(np.radians(lats))) / np.pi) / 2
+    return mx, my
+
+def grid_cell_ids_np(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """위경도 배열 -> 정수 격자 셀 ID 배열"""
+    rows = np.floor((lats + 90) / GRID_CELL_DEG).astype(np.int64)
+    cols = np.floor((lons + 180) / GRID_CELL_DEG).astype(np.int64)
+    return rows * GRID_COLS + cols
+
+def grid_row_col(lat: float, lon: float) -> tuple:
+    """위경도 -> 격자 (행, 열)"""
+    return floor((lat + 90) / GRID_CELL_DEG), floor((lon + 180) / GRID_CELL_DEG)
+
+def grid_cell_id(lat: float, lon: float) -> int:
+    """위경도 -> 정수 격자 셀 ID"""
+    row, col = grid_row_col(lat, lon)
+    return row * GRID_COLS + col
+
+def grid_cells_in_radius(lat: float, lon: float, radius_m: float) -> List[int]:
+    """중심점에서 반경 radius_m 안에 걸치는 모든 격자 셀 ID"""
+    dlat = radius_m / METERS_PER_DEG_LAT
+    # 극지방에서 0으로 나누지 않도록 cos 값 하한 설정
+    dlon = radius_m / (METERS_PER_DEG_LAT * max(cos(radians(lat)), 0.01))
+    min_row, min_col = grid_row_col(lat - dlat, lon - dlon)
+    max_row, max_col = grid_row_col(lat + dlat, lon + dlon)
+    return [
+        row * GRID_COLS + col
+        for row in range(min_row, max_row + 1)
+        for col in range(min_col, max_col + 1)
+    ]
+
+def tile_bounds(z: int, x: int, y: int) -> tuple:
+    """슬리피 맵 타일 (z, x, y) -> (남, 서, 북, 동) 위경도 범위"""
+    n = 2 ** z
+    west = x / n * 360 - 180
+    east = (x + 1) / n * 360 - 180
+    north = degrees(atan(sinh(pi * (1 - 2 * y / n))))
+    south = degrees(atan(sinh(pi * (1 - 2 * (y + 1) / n))))
+    return south, west, north, east
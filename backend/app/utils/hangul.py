@@ -0,0 +1,23 @@
+# 한글 음절 초성 (호환용 자모, 키보드로 입력되는 문자)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+HANGUL_BASE = 0xAC00  # '가'
+HANGUL_LAST = 0xD7A3  # '힣'
+SYLLABLES_PER_CHOSEONG = 21 * 28  # 중성 21개 x 종성 28개
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로 유지)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // SYLLABLES_PER_CHOSEONG])
+        else:
+            result.append(char)
+    return "".join(result)
+
+def is_choseong_query(text: str) -> bool:
+    """공백을 제외한 모든 문자가 초성인지 확인 (예: "ㄱㄴㅇ")"""
+    chars = "".join(text.split())
+    return bool(chars) and all(char in CHOSEONG_SET for char in chars)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+정류소 거리 계산 벤치마크
+기존 math 기반 반복문과 NumPy 벡터화 계산, 격자 인덱스 조회를 합성 정류소 데이터로 비교합니다.
+
+사용법: python benchmarks/haversine_benchmark.py [정류소 수 ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.geo import haversine  # noqa: E402
+from app.services.station_index import StationCatalog, StationSpatialIndex  # noqa: E402
+
+# 서울/경기 일대 범위
+LAT_RANGE = (37.0, 38.0)
+LON_RANGE = (126.5, 127.7)
+CENTER = (37.5, 127.0)
+RADIUS_M = 300
+
+def make_catalog(n: int, seed: int = 42) -> StationCatalog:
+    """합성 정류소 카탈로그 생성"""
+    rng = np.random.default_rng(seed)
+    return StationCatalog(
+        [str(i) for i in range(n)],
+        [f"정류소{i}" for i in range(n)],
+        rng.uniform(*LON_RANGE, n),
+        rng.uniform(*LAT_RANGE, n),
+        ["SEL"] * n
+    )
+
+def timeit(func, repeat: int = 3) -> float:
+    """최소 실행 시간 (단위: ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def run(n: int):
+    catalog = make_catalog(n)
+    lats = catalog.latitudes.tolist()
+    lons = catalog.longitudes.tolist()
+    lat, lon = CENTER
+
+    def scalar_loop():
+        return [i for i in range(n) if haversine(lat, lon, lats[i], lons[i]) <= RADIUS_M]
+
+    def vectorized():
+        return np.flatnonzero(catalog.distances(lat, lon) <= RADIUS_M)
+
+    index = StationSpatialIndex()
+    index.build(catalog)
+
+    def grid_query():
+        return index.query_radius(lat, lon, RADIUS_M)[0]
+
+    expected = sorted(scalar_loop())
+    assert sorted(vectorized().tolist()) == expected
+    assert sorted(grid_query().tolist()) == expected
+
+    loop_ms = timeit(scalar_loop)
+    vec_ms = timeit(vectorized)
+    grid_ms = timeit(grid_query, repeat=20)
+    print(f"{n:>9,} | {loop_ms:>10.2f} | {vec_ms:>10.2f} | {grid_ms:>10.3f} | {loop_ms / vec_ms:>6.1f}x | {len(expected):>5}")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"🚏 반경 {RADIUS_M}m 정류소 검색 (단위: ms)")
+    print(f"{'정류소 수':>9} | {'math 반복':>10} | {'NumPy':>10} | {'격자+NumPy':>10} | {'배속':>7} | {'결과':>5}")
+    for n in sizes:
+        run(n)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+서울/경기도 버스 API 모의 서버 (부하 테스트용)
+getStationByUid, getRouteByStation, getBusArrivalListv2 응답을 BusStationRouter가 파싱하는 형태 그대로 만들어 줍니다.
+정류소는 로컬 bus_stations 테이블 기준이며, 노선/도착 정보는 ars_id로 시드를 정해 생성합니다 (MOCK_FIXTURES로 덮어쓰기 가능).
+
+사용법: python benchmarks/mock_upstream.py [포트]
+앱 연결: SEL_API_BASE_URL=http://127.0.0.1:9000 KYG_API_BASE_URL=http://127.0.0.1:9000 python main.py
+
+환경 변수:
+    MOCK_LATENCY_DIST     지연 분포 (fixed, uniform, exponential, lognormal, 기본 lognormal)
+    MOCK_LATENCY_MS       지연 시간 중앙값/평균 (단위: ms, 기본 50)
+    MOCK_LATENCY_SPREAD   분포 폭 (uniform: ±비율, lognormal: sigma, 기본 0.5)
+    MOCK_ERROR_RATE       HTTP 500 응답 비율 (기본 0)
+    MOCK_TIMEOUT_RATE     응답하지 않고 MOCK_TIMEOUT_SECONDS 동안 대기하는 비율 (기본 0)
+    MOCK_TIMEOUT_SECONDS  응답 지연 시간 (단위: 초, 기본 30)
+    MOCK_SINGLE_ITEM_RATE 목록 대신 항목 하나를 dict로 주는 비율 (실제 API 동작, 기본 0.05)
+    MOCK_FIXTURES         정류소별 고정 응답 JSON 파일 ({"ars_id": {"routes": [...], "arrivals": [...], "kyg": [...]}})
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Query  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from config import settings  # noqa: E402
+
+LATENCY_DIST = os.getenv("MOCK_LATENCY_DIST", "lognormal")
+LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", "50"))
+LATENCY_SPREAD = float(os.getenv("MOCK_LATENCY_SPREAD", "0.5"))
+ERROR_RATE = float(os.getenv("MOCK_ERROR_RATE", "0"))
+TIMEOUT_RATE = float(os.getenv("MOCK_TIMEOUT_RATE", "0"))
+TIMEOUT_SECONDS = float(os.getenv("MOCK_TIMEOUT_SECONDS", "30"))
+SINGLE_ITEM_RATE = float(os.getenv("MOCK_SINGLE_ITEM_RATE", "0.05"))
+FIXTURES_PATH = os.getenv("MOCK_FIXTURES")
+
+ROUTE_PREFIXES = ["", "", "", "N", "M"]
+DIRECTIONS = ["서울역", "강남역", "수원역", "상계동", "시청", "잠실", "판교", "의정부"]
+
+app = FastAPI(title="Mock Bus API")
+calls = Counter()
+stations = {}
+fixtures = {}
+
+def load_stations():
+    """bus_stations 테이블의 정류소 (ars_id -> location)"""
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT ars_id, location FROM bus_stations")).fetchall()
+    return {row[0]: row[1] or "SEL" for row in rows}
+
+def station_rng(ars_id: str) -> random.Random:
+    """정류소별 고정 시드 난수 (같은 정류소는 항상 같은 노선 목록)"""
+    return random.Random(zlib.crc32(ars_id.encode()))
+
+def station_routes(ars_id: str) -> list:
+    """정류소 경유 노선 생성 (노선 ID, 번호, 유형, 배차 간격, 위상, 방면)"""
+    rng = station_rng(ars_id)
+    routes = []
+    for _ in range(rng.randint(1, 12)):
+        number = rng.choice(ROUTE_PREFIXES) + str(rng.randint(1, 9999))
+        routes.append({
+            "id": str(100000000 + rng.randint(0, 99999999)),
+            "name": number,
+            "type": "6" if number.startswith("N") else str(rng.choice([1, 2, 3, 4, 5])),
+            "headway": rng.randint(300, 1200),
+            "phase": rng.randint(0, 1200),
+            "direction": rng.choice(DIRECTIONS)
+        })
+    return routes
+
+def next_arrivals(route: dict) -> tuple:
+    """현재 시각 기준 다음 두 대의 도착 예정 시간 (단위: 초)"""
+    first = route["headway"] - int(time.time() + route["phase"]) % route["headway"]
+    return first, first + route["headway"]
+
+def arrival_msg(seconds: int) -> str:
+    """서울 API 도착 메시지 형식"""
+    if seconds < 60:
+        return "곧 도착"
+    return f"{seconds // 60}분{seconds % 60}초후[{seconds // 90 + 1}번째 전]"
+
+def item_list(items: list):
+    """목록 응답 (항목이 하나뿐이거나 확률에 따라 dict 하나로 응답하는 실제 API 특성 재현)"""
+    if not items:
+        return None
+    if len(items) == 1 or random.random() < SINGLE_ITEM_RATE:
+        return items[0]
+    return items
+
+async def simulate(endpoint: str):
+    """지연/오류 주입 (오류 응답이면 JSONResponse 반환)"""
+    calls[endpoint] += 1
+    if LATENCY_DIST == "fixed":
+        delay = LATENCY_MS
+    elif LATENCY_DIST == "uniform":
+        delay = random.uniform(LATENCY_MS * (1 - LATENCY_SPREAD), LATENCY_MS * (1 + LATENCY_SPREAD))
+    elif LATENCY_DIST == "exponential":
+        delay = random.expovariate(1 / LATENCY_MS) if LATENCY_MS > 0 else 0
+    else:
+        delay = random.lognormvariate(0, LATENCY_SPREAD) * LATENCY_MS
+    await asyncio.sleep(max(delay, 0) / 1000)
+
+    roll = random.random()
+    if roll < TIMEOUT_RATE:
+        calls["timeouts"] += 1
+        await asyncio.sleep(TIMEOUT_SECONDS)
+    elif roll < TIMEOUT_RATE + ERROR_RATE:
+        calls["errors"] += 1
+        return JSONResponse(status_code=500, content={"error": "mock upstream error"})
+    return None
+
+@app.get("/api/rest/stationinfo/getRouteByStation")
+async def get_route_by_station(arsId: str = Query(...)):
+    """서울 정류소 경유 노선 목록"""
+    error = await simulate("getRouteByStation")
+    if error:
+        return error
+
+    if arsId in fixtures and "routes" in fixtures[arsId]:
+        items = fixtures[arsId]["routes"]
+    elif arsId in stations:
+        items = [
+            {"busRouteId": route["id"], "busRouteNm": route["name"], "busRouteType": route["type"]}
+            for route in station_routes(arsId)
+        ]
+    else:
+        items = []
+    return {"msgHeader": {"headerCd": "0"}, "msgBody": {"itemList": item_list(items)}}
+
+@app.get("/api/rest/stationinfo/getStationByUid")
+async def get_station_by_uid(arsId: str = Query(...)):
+    """서울 정류소 실시간 도착 정보"""
+    error = await simulate("getStationByUid")
+    if error:
+        return error
+
+    if arsId in fixtures and "arrivals" in fixtures[arsId]:
+        items = fixtures[arsId]["arrivals"]
+    elif arsId in stations:
+        items = []
+        for route in station_routes(arsId):
+            first, second = next_arrivals(route)
+            night_off = route["name"].startswith("N") and route["phase"] % 2
+            items.append({
+                "busRouteId": route["id"],
+                "rtNm": route["name"],
+                "arrmsg1": "운행종료" if night_off else arrival_msg(first),
+                "arrmsg2": "운행종료" if night_off else arrival_msg(second),
+                "adirection": route["direction"]
+            })
+    else:
+        items = []
+    return {"msgHeader": {"headerCd": "0"}, "msgBody": {"itemList": item_list(items)}}
+
+@app.get("/6410000/busarrivalservice/v2/getBusArrivalListv2")
+async def get_bus_arrival_list(stationId: str = Query(...)):
+    """경기도 정류소 실시간 도착 정보"""
+    error = await simulate("getBusArrivalListv2")
+    if error:
+        return error
+
+    if stationId in fixtures and "kyg" in fixtures[stationId]:
+        items = fixtures[stationId]["kyg"]
+    elif stationId in stations:
+        items = []
+        for route in station_routes(stationId):
+            first, second = next_arrivals(route)
+            items.append({
+                "routeId": int(route["id"]),
+                "routeName": route["name"],
+                "routeTypeCd": int(route["type"]) + 10,
+                "routeDestName": route["direction"],
+                "predictTimeSec1": first,
+                "locationNo1": first // 90 + 1,
+                # 다음 차량 정보가 없으면 빈 문자열 (실제 API 특성)
+                "predictTimeSec2": second if second < 1800 else "",
+                "locationNo2": second // 90 + 1 if second < 1800 else ""
+            })
+    else:
+        items = []
+
+    if not items:
+        return {"response": {"msgHeader": {"resultCode": 4, "resultMessage": "결과가 존재하지 않습니다."}}}
+    return {"response": {
+        "msgHeader": {"resultCode": 0, "resultMessage": "정상적으로 처리되었습니다."},
+        "msgBody": {"busArrivalList": item_list(items)}
+    }}
+
+@app.get("/mock/stats")
+async def mock_stats():
+    """엔드포인트별 호출 수 (캐시 효과 확인용)"""
+    return dict(calls)
+
+def main():
+    global stations, fixtures
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9000
+    stations = load_stations()
+    if FIXTURES_PATH:
+        with open(FIXTURES_PATH, encoding="utf-8") as f:
+            fixtures = json.load(f)
+    print(f"🧪 모의 버스 API 서버: 정류소 {len(stations)}개, 고정 응답 {len(fixtures)}개, "
+          f"지연 {LATENCY_DIST} {LATENCY_MS}ms, 오류 {ERROR_RATE:.0%}, 응답 없음 {TIMEOUT_RATE:.0%}")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화/압축 벤치마크
+정류소 이름 검색 결과 형태의 큰 응답을 FastAPI 기본 JSONResponse와 ORJSONResponse로 만들고,
+압축 없음/gzip/brotli 전송 크기와 압축 시간을 비교합니다.
+
+사용법: python benchmarks/response_benchmark.py [정류소 수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from app.utils.compression import BrotliCompressor, GzipCompressor  # noqa: E402
+from config import settings  # noqa: E402
+
+SYLLABLES = list("가나다라마바사아자차카타파하강남북동서신중역앞뒤입구시청로길공원학교병원아파트")
+SUFFIXES = ["역", "입구", "사거리", "앞", "정류장", "삼거리", "아파트"]
+
+def make_search_result(n: int, seed: int = 42) -> dict:
+    """합성 정류소 검색 결과 (/api/stations/search 응답과 같은 구조)"""
+    rng = np.random.default_rng(seed)
+    stations = []
+    for i in range(n):
+        length = int(rng.integers(2, 6))
+        stations.append({
+            "stNm": "".join(rng.choice(SYLLABLES, length)) + rng.choice(SUFFIXES),
+            "arsId": str(10000 + i),
+            "x": float(126.8 + rng.random() * 0.4),
+            "y": float(37.4 + rng.random() * 0.3)
+        })
+    return {"success": True, "stations": stations, "next": None}
+
+def timeit(func, repeat: int = 5) -> float:
+    """최소 실행 시간 (단위: ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else settings.SEARCH_MAX_LIMIT * 10
+    content = make_search_result(n)
+
+    # 라우트가 dict를 반환하면 FastAPI는 jsonable_encoder로 변환한 뒤 응답 클래스로 render
+    def render_json():
+        return JSONResponse(jsonable_encoder(content)).body
+
+    def render_orjson_default():
+        return ORJSONResponse(jsonable_encoder(content)).body
+
+    # 라우트가 ORJSONResponse를 직접 반환하면 jsonable_encoder를 거치지 않음
+    def render_orjson():
+        return ORJSONResponse(content).body
+
+    json_body = render_json()
+    body = render_orjson()
+    assert json_body == render_orjson_default() == body
+
+    json_ms = timeit(render_json)
+    print(f"📦 정류소 {n:,}개 검색 결과 응답 (단위: ms, 크기 {len(body):,}B)")
+    print(f"{'직렬화':>24} | {'시간':>8} | {'배속':>6}")
+    for name, render in [
+        ("JSONResponse (기존)", None),
+        ("기본 ORJSONResponse", render_orjson_default),
+        ("ORJSONResponse 직접 반환", render_orjson)
+    ]:
+        render_ms = timeit(render) if render else json_ms
+        print(f"{name:>24} | {render_ms:>8.2f} | {json_ms / render_ms:>5.1f}x")
+
+    print()
+    print(f"{'압축':>12} | {'시간':>8} | {'전송 크기':>10} | {'비율':>6}")
+    print(f"{'없음':>12} | {0:>8.2f} | {len(body):>10,} | {1:>6.1%}")
+    compressors = [
+        (f"gzip-{settings.RESPONSE_GZIP_LEVEL}", lambda: GzipCompressor(settings.RESPONSE_GZIP_LEVEL)),
+        (f"br-{settings.RESPONSE_BROTLI_QUALITY}", lambda: BrotliCompressor(settings.RESPONSE_BROTLI_QUALITY)),
+        ("br-11", lambda: BrotliCompressor(11))
+    ]
+    for name, make in compressors:
+        compressed = make().finish(body)
+        compress_ms = timeit(lambda: make().finish(body), repeat=3)
+        print(f"{name:>12} | {compress_ms:>8.2f} | {len(compressed):>10,} | {len(compressed) / len(body):>6.1%}")
+
+    # 변경 전: JSONResponse + 압축 없음, 변경 후: ORJSONResponse 직접 반환 + brotli (기본 설정)
+    after_body = BrotliCompressor(settings.RESPONSE_BROTLI_QUALITY).finish(body)
+    after_ms = timeit(lambda: BrotliCompressor(settings.RESPONSE_BROTLI_QUALITY).finish(render_orjson()), repeat=3)
+    print()
+    print(f"✅ 변경 전 {json_ms:.2f}ms / {len(json_body):,}B -> 변경 후 {after_ms:.2f}ms / {len(after_body):,}B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+정류소 이름 검색 벤치마크
+SQLite LIKE '%검색어%' 전체 스캔과 n-gram 역색인 검색을 합성 정류소 데이터로 비교합니다.
+
+사용법: python benchmarks/station_search_benchmark.py [정류소 수]
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.station_index import StationCatalog, StationSpatialIndex  # noqa: E402
+from app.services.station_search_index import StationNameIndex  # noqa: E402
+
+SYLLABLES = list("가나다라마바사아자차카타파하강남북동서신중역앞뒤입구시청로길공원학교병원아파트")
+SUFFIXES = ["역", "입구", "사거리", "앞", "정류장", "삼거리", "아파트"]
+QUERIES = ["역", "강남", "시청앞", "공원입구", "학교앞정류장"]
+
+def make_names(n: int, seed: int = 42) -> list:
+    """합성 정류소 이름 생성"""
+    rng = np.random.default_rng(seed)
+    names = []
+    for _ in range(n):
+        length = int(rng.integers(2, 6))
+        base = "".join(rng.choice(SYLLABLES, length))
+        names.append(base + rng.choice(SUFFIXES))
+    return names
+
+def timeit(func, repeat: int = 5) -> float:
+    """최소 실행 시간 (단위: ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    names = make_names(n)
+
+    # 비교 대상: SQLite LIKE 스캔 (bus_stations.station_name 과 같은 구조)
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE bus_stations (id INTEGER PRIMARY KEY, station_name VARCHAR(100))")
+    conn.execute("CREATE INDEX ix_bus_stations_station_name ON bus_stations (station_name)")
+    conn.executemany("INSERT INTO bus_stations (station_name) VALUES (?)", [(name,) for name in names])
+
+    index = StationSpatialIndex()
+    name_index = StationNameIndex(index)
+    catalog = StationCatalog([str(i) for i in range(n)], names, [127.0] * n, [37.5] * n, ["SEL"] * n)
+    start = time.perf_counter()
+    index.build(catalog, "benchmark")
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # ensure_fresh 가 DB 를 조회하지 않도록 재확인 주기를 무한대로 설정
+    index.refresh_seconds = float("inf")
+
+    print(f"🔍 정류소 {n:,}개 이름 검색 (단위: ms, 색인 생성 {build_ms:.1f}ms)")
+    print(f"{'검색어':>10} | {'LIKE 스캔':>10} | {'n-gram':>10} | {'배속':>7} | {'결과':>6}")
+    for query in QUERIES:
+        def like_scan():
+            return conn.execute(
+                "SELECT id FROM bus_stations WHERE station_name LIKE ?", (f"%{query}%",)
+            ).fetchall()
+
+        def ngram_search():
+            return name_index.search(None, query)
+
+        assert [row[0] - 1 for row in like_scan()] == ngram_search()
+        like_ms = timeit(like_scan)
+        ngram_ms = timeit(ngram_search)
+        print(f"{query:>10} | {like_ms:>10.3f} | {ngram_ms:>10.3f} | {like_ms / ngram_ms:>6.1f}x | {len(ngram_search()):>6}")
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,99 @@ class Settings:
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
+    # 정류소 인덱스 설정 (DB 변경 확인 주기, 단위: 초)
+    STATION_INDEX_REFRESH_SECONDS: int = int(os.getenv("STATION_INDEX_REFRESH_SECONDS", "30"))
+    # 주변 정류소 검색 방식 (memory: 프로세스 내 인덱스, sql: DB 격자 셀 인덱스)
+    NEARBY_SEARCH_MODE: str = os.getenv("NEARBY_SEARCH_MODE", "memory")
+    # 정류소 이름 검색 방식 (memory: 프로세스 내 n-gram 색인, fts: SQLite FTS5)
+    STATION_SEARCH_MODE: str = os.getenv("STATION_SEARCH_MODE", "memory")
+    # 정류소 이름 검색 결과 개수 (기본값, 최대값)
+    SEARCH_DEFAULT_LIMIT: int = int(os.getenv("SEARCH_DEFAULT_LIMIT", "100"))
+    SEARCH_MAX_LIMIT: int = int(os.getenv("SEARCH_MAX_LIMIT", "1000"))
+    
+    # 외부 버스 API 주소 (부하 테스트 시 benchmarks/mock_upstream.py 주소로 변경)
+    SEL_API_BASE_URL: str = os.getenv("SEL_API_BASE_URL", "http://ws.bus.go.kr")
+    # 경기도 API는 SSL 문제가 있으므로 HTTP로 호출
+    KYG_API_BASE_URL: str = os.getenv("KYG_API_BASE_URL", "http://apis.data.go.kr")
+    
+    # 외부 버스 API 연결 설정 (호스트별 연결 풀, 타임아웃 단위: 초)
+    UPSTREAM_MAX_CONNECTIONS: int = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "50"))
+    UPSTREAM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    UPSTREAM_KEEPALIVE_EXPIRY: float = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "30"))
+    UPSTREAM_CONNECT_TIMEOUT: float = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "3"))
+    UPSTREAM_READ_TIMEOUT: float = float(os.getenv("UPSTREAM_READ_TIMEOUT", "10"))
+    UPSTREAM_POOL_TIMEOUT: float = float(os.getenv("UPSTREAM_POOL_TIMEOUT", "5"))
+    # 외부 API 호출 1건의 전체 제한 시간 (초과 시 해당 호출만 빈 결과로 처리)
+    UPSTREAM_CALL_TIMEOUT: float = float(os.getenv("UPSTREAM_CALL_TIMEOUT", "5"))
+    # 엔드포인트별 전체 제한 시간 (재시도 포함, 단위: 초)
+    UPSTREAM_ARRIVAL_DEADLINE: float = float(os.getenv("UPSTREAM_ARRIVAL_DEADLINE", "3"))
+    UPSTREAM_ROUTE_DEADLINE: float = float(os.getenv("UPSTREAM_ROUTE_DEADLINE", "5"))
+    # 실패 시 재시도 횟수와 지수 백오프 기준 시간 (단위: 초, 매번 ±50% 무작위)
+    UPSTREAM_RETRIES: int = int(os.getenv("UPSTREAM_RETRIES", "2"))
+    UPSTREAM_BACKOFF_BASE: float = float(os.getenv("UPSTREAM_BACKOFF_BASE", "0.2"))
+    # 응답이 이 시간보다 늦으면 같은 요청을 한 번 더 보냄 (단위: 초, 0이면 사용 안 함)
+    UPSTREAM_HEDGE_DELAY: float = float(os.getenv("UPSTREAM_HEDGE_DELAY", "0"))
+    # 호스트별 회로 차단기 (연속 실패 횟수, 차단 유지 시간 단위: 초)
+    UPSTREAM_BREAKER_FAILURES: int = int(os.getenv("UPSTREAM_BREAKER_FAILURES", "5"))
+    UPSTREAM_BREAKER_RESET: float = float(os.getenv("UPSTREAM_BREAKER_RESET", "30"))
+    # API/서비스 키별 호출 한도 (초당 호출 수, 순간 최대 호출 수, 일일 호출 수 0이면 제한 없음)
+    UPSTREAM_RATE_PER_SECOND: float = float(os.getenv("UPSTREAM_RATE_PER_SECOND", "20"))
+    UPSTREAM_BURST: float = float(os.getenv("UPSTREAM_BURST", "20"))
+    UPSTREAM_DAILY_QUOTA: int = int(os.getenv("UPSTREAM_DAILY_QUOTA", "0"))
+    # 일일 한도 중 대화형 요청용으로 남겨둘 비율 (남은 양이 이 이하면 백그라운드 호출 중단)
+    UPSTREAM_DAILY_RESERVE: float = float(os.getenv("UPSTREAM_DAILY_RESERVE", "0.2"))
+    # 호출 한도 대기열에 쌓아둘 수 있는 백그라운드 요청 수 (넘으면 버림)
+    UPSTREAM_MAX_BACKGROUND_QUEUE: int = int(os.getenv("UPSTREAM_MAX_BACKGROUND_QUEUE", "20"))
+    # 도착 정보 캐시 유지 시간 (단위: 초) 및 최대 정류소 수
+    ARRIVAL_CACHE_TTL: float = float(os.getenv("ARRIVAL_CACHE_TTL", "15"))
+    ARRIVAL_CACHE_MAX_SIZE: int = int(os.getenv("ARRIVAL_CACHE_MAX_SIZE", "2000"))
+    # 외부 API 장애 시 만료된 도착 정보를 대신 응답할 수 있는 최대 경과 시간 (단위: 초)
+    ARRIVAL_CACHE_MAX_STALE: float = float(os.getenv("ARRIVAL_CACHE_MAX_STALE", "300"))
+    # /arrival_info stale-while-revalidate: TTL이 지난 도착 정보도 이 시간까지는 바로 응답하고 백그라운드에서 갱신
+    # (단위: 초, 0이면 사용 안 함)
+    ARRIVAL_SWR_MAX_STALE: float = float(os.getenv("ARRIVAL_SWR_MAX_STALE", "60"))
+    # 정류소 경유 노선 목록 DB 캐시 유지 시간 (단위: 초, 기본 1일)
+    ROUTE_CACHE_TTL: int = int(os.getenv("ROUTE_CACHE_TTL", "86400"))
+    # 만료된 노선 목록 백그라운드 갱신 주기 (단위: 초) 및 한 번에 갱신할 정류소 수
+    ROUTE_CACHE_REFRESH_INTERVAL: int = int(os.getenv("ROUTE_CACHE_REFRESH_INTERVAL", "3600"))
+    ROUTE_CACHE_REFRESH_BATCH: int = int(os.getenv("ROUTE_CACHE_REFRESH_BATCH", "100"))
+    # 도착 정보 일괄 조회: 요청당 최대 정류소 수, 지역별 동시 외부 API 조회 수
+    ARRIVAL_BATCH_MAX_SIZE: int = int(os.getenv("ARRIVAL_BATCH_MAX_SIZE", "100"))
+    ARRIVAL_BATCH_CONCURRENCY: int = int(os.getenv("ARRIVAL_BATCH_CONCURRENCY", "8"))
+    # 즐겨찾기 정류소 도착 정보 미리 갱신 (사용 여부, 확인 주기 단위: 초)
+    ARRIVAL_PREFETCH_ENABLED: bool = os.getenv("ARRIVAL_PREFETCH_ENABLED", "True").lower() == "true"
+    ARRIVAL_PREFETCH_TICK: float = float(os.getenv("ARRIVAL_PREFETCH_TICK", "2"))
+    # 정류소별 갱신 간격 = MAX_INTERVAL / 저장한 사용자 수 (MIN_INTERVAL 이상, 단위: 초)
+    ARRIVAL_PREFETCH_MIN_INTERVAL: float = float(os.getenv("ARRIVAL_PREFETCH_MIN_INTERVAL", "12"))
+    ARRIVAL_PREFETCH_MAX_INTERVAL: float = float(os.getenv("ARRIVAL_PREFETCH_MAX_INTERVAL", "60"))
+    # 미리 갱신할 최대 정류소 수, 동시 외부 API 조회 수, 즐겨찾기 목록 다시 읽는 주기 (단위: 초)
+    ARRIVAL_PREFETCH_MAX_STATIONS: int = int(os.getenv("ARRIVAL_PREFETCH_MAX_STATIONS", "500"))
+    ARRIVAL_PREFETCH_CONCURRENCY: int = int(os.getenv("ARRIVAL_PREFETCH_CONCURRENCY", "4"))
+    ARRIVAL_PREFETCH_RELOAD_SECONDS: float = float(os.getenv("ARRIVAL_PREFETCH_RELOAD_SECONDS", "60"))
+    
+    # 지역별 버스 API 제공자 설정 (동시 호출 수, 연결 풀 크기, 도착 정보 캐시 TTL 단위: 초)
+    # 한 지역 API가 느려져도 다른 지역 요청에 영향을 주지 않도록 지역마다 따로 제한
+    SEL_CONCURRENCY: int = int(os.getenv("SEL_CONCURRENCY", "32"))
+    SEL_MAX_CONNECTIONS: int = int(os.getenv("SEL_MAX_CONNECTIONS", str(UPSTREAM_MAX_CONNECTIONS)))
+    SEL_ARRIVAL_TTL: float = float(os.getenv("SEL_ARRIVAL_TTL", str(ARRIVAL_CACHE_TTL)))
+    SEL_ROUTE_TTL: int = int(os.getenv("SEL_ROUTE_TTL", str(ROUTE_CACHE_TTL)))
+    KYG_CONCURRENCY: int = int(os.getenv("KYG_CONCURRENCY", "16"))
+    KYG_MAX_CONNECTIONS: int = int(os.getenv("KYG_MAX_CONNECTIONS", str(UPSTREAM_MAX_CONNECTIONS)))
+    KYG_ARRIVAL_TTL: float = float(os.getenv("KYG_ARRIVAL_TTL", str(ARRIVAL_CACHE_TTL)))
+    # 지역 제공자 동시 호출 자리를 기다리는 최대 시간 (단위: 초, 넘으면 캐시된 값 또는 오류)
+    PROVIDER_QUEUE_TIMEOUT: float = float(os.getenv("PROVIDER_QUEUE_TIMEOUT", "2"))
+    
+    # 실시간 도착 정보 구독 (정류소 조회 주기 단위: 초, 연결 하나가 구독할 수 있는 최대 정류소 수)
+    ARRIVAL_STREAM_INTERVAL: float = float(os.getenv("ARRIVAL_STREAM_INTERVAL", "15"))
+    ARRIVAL_STREAM_MAX_STATIONS: int = int(os.getenv("ARRIVAL_STREAM_MAX_STATIONS", "20"))
+    
+    # 응답 압축 (이 크기 미만 응답은 압축하지 않음 단위: 바이트, gzip 레벨 1~9, brotli 품질 0~11)
+    RESPONSE_COMPRESSION_MIN_SIZE: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+    RESPONSE_GZIP_LEVEL: int = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+    RESPONSE_BROTLI_QUALITY: int = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+    # ndjson 스트리밍 검색 결과를 한 번에 보내는 줄 수
+    NDJSON_CHUNK_SIZE: int = int(os.getenv("NDJSON_CHUNK_SIZE", "200"))
+    
     @classmethod
     def validate_api_keys(cls) -> dict:
         """API 키 유효성 검사"""
@@ -1,25 +1,65 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from app.routes.auth_router import AuthRouter
 from app.routes.bus_station_router import BusStationRouter
 from app.routes.saved_routes_router import SavedRoutesRouter
-from app.database.connection import engine, Base
+from app.database.connection import engine, Base, SessionLocal
+from app.database.station_fts import ensure_station_fts
+from app.utils.compression import CompressionMiddleware
 from app.models.user_model import User  # 모델들을 명시적으로 import
 from app.models.bus_station_model import BusStation  # 버스 정류소 모델 import
 from app.models.saved_route_model import SavedRoute  # 즐겨찾기 모델 import
+from app.models.station_route_cache_model import StationRouteCache  # 정류소 노선 목록 캐시 모델 import
+from app.services.station_index import station_index
+from app.services.upstream_client import upstream_clients
+from app.services.route_cache import route_cache
+from app.services.arrival_prefetcher import arrival_prefetcher
+from app.services.bus_providers import provider_registry
+from app.services.arrival_hub import arrival_hub
 from config import settings
 import os
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
+ensure_station_fts(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 처리"""
+    # 정류소 공간 인덱스 생성 (주변/최근접 정류소 검색용)
+    # sql 모드에서는 주변 검색을 DB가 처리하므로 첫 /knn 요청 때 생성
+    if settings.NEARBY_SEARCH_MODE != "sql":
+        db = SessionLocal()
+        try:
+            station_index.rebuild(db)
+        except Exception as e:
+            print(f"⚠️ 정류소 인덱스 생성 실패: {e}")
+        finally:
+            db.close()
+    
+    # 외부 버스 API 클라이언트 (연결 풀 공유)
+    await upstream_clients.start()
+    # 만료된 정류소 노선 목록 백그라운드 갱신 (정류소마다 해당 지역 제공자로 조회)
+    route_cache.start(provider_registry.get_routes_by_station)
+    # 즐겨찾기 정류소 도착 정보 미리 갱신 (인기 정류소 요청이 캐시에서 바로 응답되도록)
+    arrival_prefetcher.start(provider_registry.refresh_bus_list)
+    yield
+    await arrival_hub.stop()
+    await arrival_prefetcher.stop()
+    await route_cache.stop()
+    await upstream_clients.close()
 
 app = FastAPI(
     title="Bus Info API",
     description="버스 정보를 제공하는 API",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    # 큰 응답(검색/주변 정류소/즐겨찾기 목록)을 빠르게 직렬화
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
@@ -39,6 +79,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (brotli 또는 gzip, RESPONSE_COMPRESSION_MIN_SIZE 이상일 때만)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE,
+    gzip_level=settings.RESPONSE_GZIP_LEVEL,
+    brotli_quality=settings.RESPONSE_BROTLI_QUALITY
+)
+
 # 라우터 포함
 auth_router = AuthRouter()
 saved_routes_router = SavedRoutesRouter()
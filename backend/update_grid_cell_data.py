@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+기존 bus_stations 데이터에 grid_cell 컬럼과 복합 인덱스를 추가하고 값을 채우는 스크립트
+"""
+
+import sys
+from sqlalchemy import create_engine, text
+from app.utils.geo import grid_cell_id
+from config import settings
+
+def update_grid_cell_data():
+    """grid_cell 컬럼 추가 및 값 채우기"""
+    try:
+        # 데이터베이스 연결
+        engine = create_engine(settings.DATABASE_URL)
+
+        with engine.begin() as connection:
+            print("🔍 데이터베이스 연결 성공")
+
+            # 1. grid_cell 컬럼 존재 확인 후 없으면 추가
+            result = connection.execute(text("""
+                SELECT name FROM pragma_table_info('bus_stations')
+                WHERE name = 'grid_cell'
+            """))
+
+            if not result.fetchone():
+                print("➕ grid_cell 컬럼 추가 중...")
+                connection.execute(text("ALTER TABLE bus_stations ADD COLUMN grid_cell BIGINT"))
+
+            # 2. 모든 정류소의 격자 셀 계산
+            print("🔄 grid_cell 데이터 계산 중...")
+            rows = connection.execute(text("""
+                SELECT id, latitude, longitude FROM bus_stations
+            """)).fetchall()
+
+            params = [
+                {"id": row[0], "grid_cell": grid_cell_id(row[1], row[2])}
+                for row in rows
+            ]
+            if params:
+                connection.execute(
+                    text("UPDATE bus_stations SET grid_cell = :grid_cell WHERE id = :id"),
+                    params
+                )
+            print(f"✅ {len(params)}개의 행이 업데이트되었습니다.")
+
+            # 3. 복합 인덱스 생성
+            print("🔄 복합 인덱스 생성 중...")
+            connection.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_bus_stations_grid_cell_lat_lon
+                ON bus_stations (grid_cell, latitude, longitude)
+            """))
+
+            return True
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        return False
+
+def verify_update():
+    """업데이트 결과 확인"""
+    try:
+        engine = create_engine(settings.DATABASE_URL)
+
+        with engine.connect() as connection:
+            # grid_cell이 비어 있는 행 수 확인
+            result = connection.execute(text("""
+                SELECT COUNT(*) FROM bus_stations
+                WHERE grid_cell IS NULL
+            """))
+
+            missing_count = result.fetchone()[0]
+
+            # 전체 행 수 확인
+            result = connection.execute(text("SELECT COUNT(*) FROM bus_stations"))
+            total_count = result.fetchone()[0]
+
+            print(f"\n🔍 검증 결과:")
+            print(f"   - grid_cell이 없는 행: {missing_count}개")
+            print(f"   - 전체 행 수: {total_count}개")
+
+            if missing_count == 0:
+                print("🎉 모든 정류소에 grid_cell이 설정되었습니다!")
+                return True
+            else:
+                print(f"⚠️  일부 정류소({missing_count}개)에 grid_cell이 설정되지 않았습니다.")
+                return False
+
+    except Exception as e:
+        print(f"❌ 확인 중 오류 발생: {str(e)}")
+        return False
+
+def main():
+    """메인 함수"""
+    print("🚌 버스 정류소 grid_cell 데이터 업데이트 시작")
+    print("=" * 50)
+
+    # 업데이트 실행
+    if update_grid_cell_data():
+        print("\n🔍 업데이트 결과 확인 중...")
+        verify_update()
+    else:
+        print("❌ 업데이트에 실패했습니다.")
+        sys.exit(1)
+
+    print("\n✅ 업데이트가 완료되었습니다!")
+
+if __name__ == "__main__":
+    main()
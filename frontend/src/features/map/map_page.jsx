@@ -38,6 +38,7 @@ const MapPage = ({ onBack, selectedStation: initialSelectedStation }) => {
   const mapRef = useRef(null);
   const [search, setSearch] = useState('');
   const [searchResults, setSearchResults] = useState([]);
+  const [suggestions, setSuggestions] = useState([]);
   const [showResults, setShowResults] = useState(false);
   const [busInfo, setBusInfo] = useState(null);
   const [selectedStation, setSelectedStation] = useState(null);
@@ -67,6 +68,36 @@ const MapPage = ({ onBack, selectedStation: initialSelectedStation }) => {
     // eslint-disable-next-line
   }, [initialSelectedStation]);
 
+  // 입력 중 정류소 이름 자동완성 (타이핑이 잠시 멈추면 요청)
+  useEffect(() => {
+    const query = search.trim();
+    if (!query) {
+      setSuggestions([]);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch(
+          `${API_BASE_URL}/api/stations/autocomplete?q=${encodeURIComponent(query)}&limit=8`,
+          { signal: controller.signal }
+        );
+        const data = await response.json();
+        setSuggestions(data.success ? data.suggestions : []);
+      } catch (error) {
+        if (error.name !== 'AbortError') {
+          console.error('자동완성 중 오류 발생:', error);
+        }
+      }
+    }, 150);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [search]);
+
   const handleSearch = async () => {
     if (!search.trim()) {
       setSearchResults([]);
@@ -385,6 +416,7 @@ const MapPage = ({ onBack, selectedStation: initialSelectedStation }) => {
             value={search}
             onChange={e => setSearch(e.target.value)}
             onKeyDown={e => e.key === 'Enter' && handleSearch()}
+            list="station-suggestions"
             placeholder="정류소명을 입력하세요"
             style={{
               border: 'none',
@@ -398,6 +430,11 @@ const MapPage = ({ onBack, selectedStation: initialSelectedStation }) => {
               padding: '6px 0'
             }}
           />
+          <datalist id="station-suggestions">
+            {suggestions.map(suggestion => (
+              <option key={suggestion.stNm} value={suggestion.stNm} />
+            ))}
+          </datalist>
         </div>
         <IconButton onClick={handleSearch} sx={{ ml: 1 }}>
           <SearchIcon sx={{ color: '#1976d2', fontSize: 26 }} />